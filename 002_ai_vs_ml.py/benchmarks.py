@@ -0,0 +1,219 @@
+"""Scaling benchmarks for the scenes of this package, with stored baselines.
+
+Usage:
+    python benchmarks.py                    # run and compare with benchmark_baseline.json
+    python benchmarks.py --save-baseline    # run and store the results as the new baseline
+    python benchmarks.py --fixtures network network_compact --sizes 8 64 256
+
+Each (fixture, size) case renders in a fresh process at the chosen quality with
+movie writing disabled, so frames are rasterized but no video is encoded. The
+run fails when a metric exceeds its baseline by more than the threshold.
+"""
+import argparse
+import importlib
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from blocks import TreeSpec
+from profiling import peak_rss_mb
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+BASELINE_PATH = PACKAGE_DIR / "benchmark_baseline.json"
+HISTORY_PATH = PACKAGE_DIR / "benchmark_history.jsonl"
+
+# Metrics compared against the baseline; all of them are "lower is better"
+METRICS = ("build_time", "frame_time", "total_time", "peak_rss_mb")
+
+
+def complete_tree(depth: int, level: int = 0) -> dict:
+    """Complete binary tree spec with one feature per level."""
+    if level == depth:
+        return {"label": "Perfect" if level % 2 else "Ripe"}
+    return {
+        "question": f"Feature {level} high?",
+        "feature": level,
+        "threshold": 0.5,
+        "left": complete_tree(depth, level + 1),
+        "right": complete_tree(depth, level + 1),
+    }
+
+
+def network_attrs(width: int) -> dict:
+    return {"layer_widths": (width, width, width), "compact_layers": False}
+
+
+def compact_network_attrs(width: int) -> dict:
+    return {"layer_widths": (width, width, width), "compact_layers": True}
+
+
+def decision_tree_attrs(depth: int) -> dict:
+    return {
+        "spec": TreeSpec.from_dict(complete_tree(depth)),
+        "sample": [0.25 + 0.5 * (level % 2) for level in range(depth)],
+    }
+
+
+def forest_attrs(n_trees: int) -> dict:
+    return {"n_trees": n_trees}
+
+
+# fixture name -> (module, scene class, attributes for a size, default sizes)
+FIXTURES = {
+    # One code path per fixture, so each scaling curve and baseline measures one implementation
+    "network": ("neural_network_sceene", "NeuronNetworkScene", network_attrs, (8, 32, 128)),
+    "network_compact": (
+        "neural_network_sceene",
+        "NeuronNetworkScene",
+        compact_network_attrs,
+        (8, 32, 128, 512),
+    ),
+    "decision_tree": ("decision_tree_scene", "FittedDecisionTree", decision_tree_attrs, (2, 4, 6)),
+    "forest": ("random_forest_scene", "InstancedForestScene", forest_attrs, (3, 10, 30)),
+}
+
+
+class BenchmarkSceneMixin:
+    """Time mobject building, per-frame rasterization and the whole render."""
+
+    def setup(self):
+        super().setup()
+        self.frame_times = []
+        self.frames = 0
+        self.first_play_at = None
+        renderer = self.renderer
+        render = renderer.render
+        add_frame = renderer.add_frame
+
+        # render rasterizes and adds one movie frame; static backgrounds drawn
+        # by save_static_frame_data go through update_frame only and are not frames
+        def timed_render(*args, **kwargs):
+            started = time.perf_counter()
+            result = render(*args, **kwargs)
+            self.frame_times.append(time.perf_counter() - started)
+            return result
+
+        def counting_add_frame(frame, num_frames=1):
+            if not renderer.skip_animations:
+                self.frames += num_frames
+            return add_frame(frame, num_frames)
+
+        renderer.render = timed_render
+        renderer.add_frame = counting_add_frame
+        self.construct_started = time.perf_counter()
+
+    def play(self, *args, **kwargs):
+        if self.first_play_at is None:
+            self.first_play_at = time.perf_counter()
+        super().play(*args, **kwargs)
+
+
+def run_case(fixture: str, size: int, quality: str) -> dict:
+    """Worker entry point: render one fixture at one size and return its metrics."""
+    import manim as mn
+
+    module_name, class_name, make_attrs, _ = FIXTURES[fixture]
+    mn.config.quality = quality
+    mn.config.write_to_movie = False
+    mn.config.save_last_frame = False
+    mn.config.disable_caching = True
+    mn.config.progress_bar = "none"
+    mn.config.verbosity = "WARNING"
+
+    scene_class = getattr(importlib.import_module(module_name), class_name)
+    bench_class = type(class_name, (BenchmarkSceneMixin, scene_class), make_attrs(size))
+    scene = bench_class()
+
+    started = time.perf_counter()
+    scene.render()
+    total_time = time.perf_counter() - started
+
+    frame_times = scene.frame_times
+    return {
+        "fixture": fixture,
+        "size": size,
+        "build_time": (scene.first_play_at or time.perf_counter()) - scene.construct_started,
+        "frame_time": sum(frame_times) / len(frame_times) if frame_times else 0.0,
+        "frames": scene.frames,
+        "total_time": total_time,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_benchmarks(cases, quality: str) -> list:
+    # One fresh process per case so peak RSS and caches do not leak between cases
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for fixture, size in cases:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            result = pool.submit(run_case, fixture, size, quality).result()
+        print(
+            f"{fixture:>14} {size:>6}  build {result['build_time']:7.3f}s  "
+            f"frame {1000 * result['frame_time']:7.2f}ms  total {result['total_time']:7.2f}s  "
+            f"rss {result['peak_rss_mb'] or 0:7.1f}MB"
+        )
+        results.append(result)
+    return results
+
+
+def compare(results: list, baseline: list, threshold: float) -> list:
+    """Human-readable regressions of ``results`` against ``baseline``."""
+    baseline_by_case = {(entry["fixture"], entry["size"]): entry for entry in baseline}
+    regressions = []
+    for result in results:
+        reference = baseline_by_case.get((result["fixture"], result["size"]))
+        if reference is None:
+            continue
+        for metric in METRICS:
+            if not reference.get(metric) or result.get(metric) is None:
+                continue
+            ratio = result[metric] / reference[metric]
+            if ratio > 1 + threshold:
+                regressions.append(
+                    f"{result['fixture']}[{result['size']}] {metric}: "
+                    f"{result[metric]:.4g} vs baseline {reference[metric]:.4g} ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", nargs="*", choices=sorted(FIXTURES), default=sorted(FIXTURES))
+    parser.add_argument("--sizes", nargs="*", type=int, help="Override the default sizes.")
+    parser.add_argument("--quality", default="low_quality")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative slowdown.")
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    cases = [
+        (fixture, size)
+        for fixture in args.fixtures
+        for size in (args.sizes or FIXTURES[fixture][3])
+    ]
+    results = run_benchmarks(cases, args.quality)
+
+    with open(HISTORY_PATH, "a") as file:
+        file.write(json.dumps({"time": time.time(), "quality": args.quality, "results": results}) + "\n")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}, run with --save-baseline first")
+        return 0
+    with open(args.baseline) as file:
+        regressions = compare(results, json.load(file), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
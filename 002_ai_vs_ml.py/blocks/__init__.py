@@ -1,3 +1,13 @@
 from .decision_block import DecisionBlock
 from .input_block import InputBlock, OutputBlock
-from .elbow_arrow import create_elbow_arrow
\ No newline at end of file
+from .elbow_arrow import create_elbow_arrow
+from .arrow_batch import ArrowBatch, ArrowView, ArrowAnimation
+from .connection_mesh import ConnectionMesh
+from .signal_flow import SignalFlow
+from .neuron_array import NeuronArray, NeuronView, NeuronAnimation
+from .layer_activation import LayerActivation, ActivationStream
+from .text_cache import TextCache, TEXT_CACHE, cached_text
+from .shared_copy import SharedCopyMixin, shared_copy
+from .cached_bounds import CachedBoundsMixin, layout_pass
+from .decision_tree_diagram import TreeSpec, DecisionTreeDiagram
+from .grid_layout import calculate_grid_layout, grid_offsets
@@ -0,0 +1,246 @@
+from collections.abc import Sequence
+
+import manim as mn
+import numpy as np
+
+
+def elbow_control_points(starts, ends, angle=mn.TAU / 4) -> np.ndarray:
+    """Control points of elbow arrows: the midpoints pushed 0.5 along ``angle``."""
+    offset = np.array([np.cos(angle), np.sin(angle), 0]) * 0.5
+    return (np.asarray(starts) + np.asarray(ends)) / 2 + offset
+
+
+def _tip_template() -> np.ndarray:
+    """Points of the ``create_elbow_arrow`` tip, centred on the origin and pointing along +x."""
+    tip = mn.ArrowTriangleTip().scale(0.2)
+    # ArrowTriangleTip points along -x
+    return tip.rotate(mn.PI).points - tip.get_center()
+
+
+TIP_TEMPLATE = _tip_template()
+
+
+class ArrowBatch(mn.VGroup):
+    """Many elbow arrows kept as NumPy arrays and drawn as a few mobjects.
+
+    Curve control points are computed for all arrows at once, and every tip is
+    the same template triangle rotated to its curve's end tangent. Arrows of the
+    same colour share one curve VMobject and one tip VMobject with one subpath
+    per arrow, so the mobject count does not grow with N. Arrows being animated
+    are isolated in their own paths for the duration of the play, so the
+    animation can restyle them in place without replacing any submobject.
+    """
+
+    def __init__(
+        self,
+        starts,
+        ends,
+        color=mn.WHITE,
+        angle=mn.TAU / 4,
+        stroke_width: float = mn.DEFAULT_STROKE_WIDTH,
+        tip_stroke_width: float = 3,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        starts = np.array(starts, dtype=float).reshape(-1, 3)
+        ends = np.array(ends, dtype=float).reshape(-1, 3)
+        if starts.shape != ends.shape:
+            raise ValueError("starts and ends must have the same number of arrows")
+
+        controls = elbow_control_points(starts, ends, angle)
+        # Same curves as CubicBezier(start, start, control, end)
+        self.curve_points = np.stack([starts, starts, controls, ends], axis=1)
+
+        tangents = ends - controls
+        angles = np.arctan2(tangents[:, 1], tangents[:, 0])
+        cos, sin = np.cos(angles), np.sin(angles)
+        rotations = np.zeros((len(starts), 3, 3))
+        rotations[:, 0, 0], rotations[:, 0, 1] = cos, -sin
+        rotations[:, 1, 0], rotations[:, 1, 1] = sin, cos
+        rotations[:, 2, 2] = 1
+        self.tip_points = np.einsum("nij,pj->npi", rotations, TIP_TEMPLATE) + ends[:, None, :]
+
+        self.colors = np.tile(mn.color_to_rgb(color), (len(starts), 1))
+        self.stroke_width = stroke_width
+        self.tip_stroke_width = tip_stroke_width
+        self._bucket_indices = []
+        # Per arrow: number of running animations isolating it, and its curve path index
+        self._isolated = np.zeros(len(starts), dtype=int)
+        self._path_of = np.full(len(starts), -1)
+
+        self._rebuild()
+
+    @property
+    def n_arrows(self) -> int:
+        return len(self.curve_points)
+
+    def views(self) -> "ArrowViews":
+        return ArrowViews(self)
+
+    def get_starts(self) -> np.ndarray:
+        self._sync_from_points()
+        return self.curve_points[:, 0]
+
+    def get_ends(self) -> np.ndarray:
+        self._sync_from_points()
+        return self.curve_points[:, 3]
+
+    def recolor(self, indices, color):
+        """Change the colour of the given arrows in place."""
+        self._sync_from_points()
+        self.colors[indices] = mn.color_to_rgb(color)
+        return self._rebuild()
+
+    def _sync_from_points(self):
+        # Pick up shifts/scales applied to the drawn paths since the last rebuild
+        n_tip_points = len(TIP_TEMPLATE)
+        paths = iter(self.submobjects)
+        for indices, curves, tips in zip(self._bucket_indices, paths, paths):
+            if len(curves.points) == 4 * len(indices):
+                self.curve_points[indices] = curves.points.reshape(-1, 4, 3)
+            if len(tips.points) == n_tip_points * len(indices):
+                self.tip_points[indices] = tips.points.reshape(-1, n_tip_points, 3)
+
+    def _isolate(self, indices):
+        """Draw the given arrows one path pair each until they are released."""
+        self._sync_from_points()
+        np.add.at(self._isolated, indices, 1)
+        return self._rebuild()
+
+    def _release(self, indices):
+        self._sync_from_points()
+        np.subtract.at(self._isolated, indices, 1)
+        return self._rebuild()
+
+    def _redraw_isolated(self, indices):
+        """Write the colours of isolated arrows into their paths in place."""
+        indices = np.atleast_1d(indices)
+        if np.any(self._isolated[indices] == 0):
+            return self._rebuild()
+        for index in indices:
+            path = self._path_of[index]
+            for mob in self.submobjects[path : path + 2]:
+                mob.stroke_rgbas[:, :3] = self.colors[index]
+        return self
+
+    def _rebuild(self):
+        # Quantize colours so animated colours do not explode the bucket count;
+        # isolated arrows get a key of their own
+        keys = np.column_stack(
+            [
+                np.round(self.colors * 255),
+                np.where(self._isolated > 0, np.arange(self.n_arrows), -1),
+            ]
+        )
+        unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+
+        paths = []
+        self._bucket_indices = []
+        for key_index, key in enumerate(unique_keys):
+            indices = np.flatnonzero(inverse == key_index)
+            color = mn.rgb_to_color(key[:3] / 255)
+            self._path_of[indices] = len(paths)
+            curves = mn.VMobject(stroke_color=color, stroke_width=self.stroke_width, fill_opacity=0)
+            curves.set_points(self.curve_points[indices].reshape(-1, 3))
+            tips = mn.VMobject(stroke_color=color, stroke_width=self.tip_stroke_width, fill_opacity=0)
+            tips.set_points(self.tip_points[indices].reshape(-1, 3))
+            paths.extend([curves, tips])
+            self._bucket_indices.append(indices)
+
+        self.remove(*self.submobjects)
+        self.add(*paths)
+        return self
+
+
+class ArrowView:
+    """Lightweight handle to one arrow of an ``ArrowBatch``."""
+
+    __slots__ = ("batch", "index")
+
+    def __init__(self, batch: ArrowBatch, index: int):
+        self.batch = batch
+        self.index = index
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, ArrowView)
+            and other.batch is self.batch
+            and other.index == self.index
+        )
+
+    def __hash__(self):
+        return hash((id(self.batch), self.index))
+
+    def __repr__(self):
+        return f"ArrowView({self.index})"
+
+    def get_start(self) -> np.ndarray:
+        return self.batch.get_starts()[self.index].copy()
+
+    def get_end(self) -> np.ndarray:
+        return self.batch.get_ends()[self.index].copy()
+
+    def set_color(self, color):
+        self.batch.recolor(self.index, color)
+        return self
+
+    @property
+    def animate(self) -> "ArrowAnimation":
+        return ArrowAnimation(self.batch, [self.index])
+
+
+class ArrowViews(Sequence):
+    """Read-only sequence of ``ArrowView``s standing in for a list of arrow VGroups."""
+
+    def __init__(self, batch: ArrowBatch):
+        self.batch = batch
+
+    def __len__(self):
+        return self.batch.n_arrows
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ArrowView(self.batch, i) for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("arrow index out of range")
+        return ArrowView(self.batch, index)
+
+
+class ArrowAnimation(mn.Animation):
+    """Interpolate the colour of some arrows without copying the batch.
+
+    ``set_color`` records the target colour and returns the animation,
+    mirroring ``mobject.animate``.
+    """
+
+    def __init__(self, batch: ArrowBatch, indices, **kwargs):
+        self.indices = np.asarray(indices, dtype=int)
+        self.target_colors = batch.colors[self.indices].copy()
+        super().__init__(batch, **kwargs)
+
+    def set_color(self, color):
+        self.target_colors[:] = mn.color_to_rgb(color)
+        return self
+
+    def create_starting_mobject(self):
+        return self.mobject
+
+    def begin(self) -> None:
+        # The scene collects the moving submobjects after begin, so they must not change later
+        self.mobject._isolate(self.indices)
+        self.start_colors = self.mobject.colors[self.indices].copy()
+        super().begin()
+
+    def finish(self) -> None:
+        super().finish()
+        self.mobject._release(self.indices)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        batch = self.mobject
+        batch.colors[self.indices] = mn.interpolate(
+            self.start_colors, self.target_colors, self.rate_func(alpha)
+        )
+        batch._redraw_isolated(self.indices)
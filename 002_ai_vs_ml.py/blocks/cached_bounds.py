@@ -0,0 +1,90 @@
+import contextlib
+from functools import reduce
+
+import manim as mn
+import numpy as np
+
+_layout_pass_depth = 0
+
+
+@contextlib.contextmanager
+def layout_pass():
+    """Trust cached bounds without checking the family for changes.
+
+    Meant for loops that create and position many blocks, where nothing but
+    ``shift``/``scale`` (and the ``next_to``/``move_to`` built on them) touches
+    the blocks. Both update the cached bounds in place, so nothing is recomputed
+    from points inside the pass.
+    """
+    global _layout_pass_depth
+    _layout_pass_depth += 1
+    try:
+        yield
+    finally:
+        _layout_pass_depth -= 1
+
+
+class CachedBoundsMixin:
+    """Cache the bounding box of a composite mobject. Must come before the Mobject in the bases.
+
+    ``get_top``, ``next_to``, ``width`` and friends read the cached box instead of
+    stacking every point of the family. The cache stays valid while the family
+    holds the same point arrays; manim rebinds them on every transform, so a
+    transform or point change anywhere below invalidates it. ``shift`` and
+    ``scale`` move the cached box along instead of dropping it.
+    """
+
+    def _bounds_token(self) -> list:
+        return [mob.points for mob in self.get_family()]
+
+    def _valid_bounds_cache(self):
+        cache = self.__dict__.get("_bounds_cache")
+        if cache is None:
+            return None
+        if _layout_pass_depth:
+            return cache
+        bounds, token = cache
+        current = self._bounds_token()
+        # Identity, not equality: the cache keeps the arrays alive, so ids are not reused
+        if len(token) == len(current) and all(a is b for a, b in zip(token, current)):
+            return cache
+        return None
+
+    def get_bounds(self):
+        """(2, 3) array of the minimum and maximum corner, or None without points."""
+        cache = self._valid_bounds_cache()
+        if cache is None:
+            points = super().get_points_defining_boundary()
+            bounds = np.array([points.min(axis=0), points.max(axis=0)]) if len(points) else None
+            cache = (bounds, self._bounds_token())
+            self._bounds_cache = cache
+        return cache[0]
+
+    def get_points_defining_boundary(self):
+        # The two corners give the same extrema as every point of the family
+        bounds = self.get_bounds()
+        return np.zeros((0, self.dim)) if bounds is None else bounds
+
+    def length_over_dim(self, dim: int) -> float:
+        bounds = self.get_bounds()
+        return 0 if bounds is None else bounds[1, dim] - bounds[0, dim]
+
+    def shift(self, *vectors):
+        cache = self._valid_bounds_cache()
+        super().shift(*vectors)
+        if cache is not None and cache[0] is not None:
+            self._bounds_cache = (cache[0] + reduce(np.add, vectors), self._bounds_token())
+        return self
+
+    def scale(self, scale_factor: float, *args, about_point=None, about_edge=None, **kwargs):
+        cache = self._valid_bounds_cache()
+        if cache is not None and cache[0] is not None and about_point is None:
+            about_point = self.get_critical_point(mn.ORIGIN if about_edge is None else about_edge)
+        super().scale(
+            scale_factor, *args, about_point=about_point, about_edge=about_edge, **kwargs
+        )
+        if cache is not None and cache[0] is not None:
+            corners = about_point + scale_factor * (cache[0] - about_point)
+            bounds = np.array([corners.min(axis=0), corners.max(axis=0)])
+            self._bounds_cache = (bounds, self._bounds_token())
+        return self
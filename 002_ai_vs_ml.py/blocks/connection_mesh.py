@@ -0,0 +1,238 @@
+import manim as mn
+import numpy as np
+
+from .mesh_geometry import bundle_labels, complete_bipartite, convex_hull, polygon_area
+
+
+# Stroke widths are in hundredths of a frame unit in the cairo camera
+_LINE_WIDTH_MULTIPLE = 0.01
+LOD_MODES = ("auto", "full", "subsample", "bundle")
+
+
+class ConnectionMesh(mn.VGroup):
+    """Straight edges stored as (N, 3) start/end arrays with per-edge style arrays.
+
+    Edges sharing a stroke style are drawn as one VMobject with one subpath per
+    edge, so a dense mesh is a handful of mobjects instead of one ``Line`` each.
+
+    With ``lod="auto"`` the drawn representation follows the ink coverage of a
+    style bucket at the configured resolution, i.e. stroked pixels over the
+    pixel area of its convex hull: every edge up to ``full_coverage``, an evenly
+    strided subset with compensated opacity up to ``bundle_coverage``, and
+    filled bands between groups of sources and targets above it. Edges restyled
+    with ``highlight_edges`` are always drawn in full.
+    """
+
+    full_coverage = 1.0
+    bundle_coverage = 4.0
+    bundle_groups = 4
+
+    def __init__(
+        self,
+        starts,
+        ends,
+        color=mn.LIGHT_GRAY,
+        stroke_width: float = 0.5,
+        opacity: float = 0.75,
+        lod: str = "auto",
+        source_index=None,
+        target_index=None,
+        **kwargs,
+    ):
+        if lod not in LOD_MODES:
+            raise ValueError(f"lod must be one of {LOD_MODES}, got {lod!r}")
+        super().__init__(**kwargs)
+        self.lod = lod
+        self.starts = np.array(starts, dtype=float).reshape(-1, 3)
+        self.ends = np.array(ends, dtype=float).reshape(-1, 3)
+        if self.starts.shape != self.ends.shape:
+            raise ValueError("starts and ends must have the same number of edges")
+
+        n_edges = len(self.starts)
+        self.edge_colors = np.tile(mn.color_to_rgb(color), (n_edges, 1))
+        self.edge_opacities = np.full(n_edges, opacity, dtype=float)
+        self.edge_widths = np.full(n_edges, stroke_width, dtype=float)
+        # Neuron each edge leaves from and goes to; bundling groups edges by these
+        self.source_index = np.arange(n_edges) if source_index is None else np.asarray(source_index)
+        self.target_index = np.arange(n_edges) if target_index is None else np.asarray(target_index)
+        self.edge_highlighted = np.zeros(n_edges, dtype=bool)
+        # Edge indices drawn one subpath each by every path, None for LOD paths
+        self._bucket_indices = []
+        self._reference_points = []
+
+        self._rebuild()
+
+    @classmethod
+    def between(cls, sources, targets, **kwargs):
+        """Connect every source point to every target point, source-major."""
+        starts, ends, source_index, target_index = complete_bipartite(sources, targets)
+        return cls(starts, ends, source_index=source_index, target_index=target_index, **kwargs)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.starts)
+
+    def edges_from(self, source) -> np.ndarray:
+        return np.flatnonzero(np.isin(self.source_index, source))
+
+    def edges_to(self, target) -> np.ndarray:
+        return np.flatnonzero(np.isin(self.target_index, target))
+
+    def highlight_edges(self, indices, color=mn.GREEN, opacity=1.0, stroke_width=None):
+        """Restyle the given edges and regroup the drawn paths."""
+        self._sync_from_points()
+        indices = np.asarray(indices, dtype=int)
+        self.edge_colors[indices] = mn.color_to_rgb(color)
+        self.edge_opacities[indices] = opacity
+        if stroke_width is not None:
+            self.edge_widths[indices] = stroke_width
+        self.edge_highlighted[indices] = True
+        return self._rebuild()
+
+    def coverage(self, indices) -> float:
+        """Stroked pixels of the given edges over the pixel area of their hull."""
+        pixels_per_unit = mn.config.pixel_width / mn.config.frame_width
+        starts, ends = self.starts[indices], self.ends[indices]
+        lengths = np.linalg.norm(ends - starts, axis=1) * pixels_per_unit
+        # Antialiasing paints at least one pixel across, however thin the stroke
+        widths = np.maximum(self.edge_widths[indices] * _LINE_WIDTH_MULTIPLE * pixels_per_unit, 1)
+        hull = convex_hull(np.vstack([starts, ends])[:, :2])
+        area = polygon_area(hull) * pixels_per_unit**2 if len(hull) >= 3 else 0
+        ink = np.dot(lengths, widths)
+        return ink / max(area, ink, 1)
+
+    def lod_mode(self, indices) -> str:
+        """Representation ``_rebuild`` uses for a bucket of equally styled edges."""
+        if self.edge_highlighted[indices].any():
+            return "full"
+        if self.lod != "auto":
+            return self.lod
+        coverage = self.coverage(indices)
+        if coverage <= self.full_coverage:
+            return "full"
+        if coverage <= self.bundle_coverage:
+            return "subsample"
+        return "bundle"
+
+    def get_endpoints(self):
+        """Current (starts, ends) arrays, including any transforms since the last rebuild."""
+        self._sync_from_points()
+        return self.starts, self.ends
+
+    def get_edge(self, index: int) -> mn.Line:
+        """Standalone ``Line`` for one edge, e.g. as a ``MoveAlongPath`` path."""
+        self._sync_from_points()
+        return mn.Line(
+            self.starts[index],
+            self.ends[index],
+            stroke_width=self.edge_widths[index],
+            color=mn.rgb_to_color(self.edge_colors[index]),
+        ).set_opacity(self.edge_opacities[index])
+
+    def _edge_points(self, indices) -> np.ndarray:
+        starts = self.starts[indices]
+        delta = self.ends[indices] - starts
+        thirds = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+        return (starts[:, None, :] + thirds * delta[:, None, :]).reshape(-1, 3)
+
+    def _sync_from_points(self):
+        # Pick up shifts/scales applied to the drawn paths since the last rebuild
+        exact = np.zeros(self.n_edges, dtype=bool)
+        for path, indices in zip(self.submobjects, self._bucket_indices):
+            if indices is None or len(path.points) != 4 * len(indices):
+                continue
+            curves = path.points.reshape(-1, 4, 3)
+            self.starts[indices] = curves[:, 0]
+            self.ends[indices] = curves[:, 3]
+            exact[indices] = True
+        if exact.all():
+            return
+
+        # Edges that are not drawn one by one follow the affine map of the drawn points
+        pairs = [
+            (reference, path.points)
+            for path, reference in zip(self.submobjects, self._reference_points)
+            if path.points.shape == reference.shape
+        ]
+        if not pairs:
+            return
+        reference = np.vstack([pair[0] for pair in pairs])
+        current = np.vstack([pair[1] for pair in pairs])
+        if np.allclose(reference, current):
+            return
+        homogeneous = np.column_stack([reference, np.ones(len(reference))])
+        transform = np.linalg.lstsq(homogeneous, current, rcond=None)[0]
+        for endpoints in (self.starts, self.ends):
+            moved = endpoints[~exact]
+            endpoints[~exact] = np.column_stack([moved, np.ones(len(moved))]) @ transform
+        self._reference_points = [path.points.copy() for path in self.submobjects]
+
+    def _edge_path(self, indices, rgb, opacity, width) -> mn.VMobject:
+        path = mn.VMobject(
+            stroke_color=mn.rgb_to_color(rgb),
+            stroke_width=width,
+            stroke_opacity=min(opacity, 1),
+            fill_opacity=0,
+        )
+        return path.set_points(self._edge_points(indices))
+
+    def _subsample(self, indices, rgb, opacity, width) -> mn.VMobject:
+        """Evenly strided edges, opaque enough to keep the bucket's overall tone."""
+        ratio = max(self.coverage(indices) / self.full_coverage, 1)
+        kept = indices[np.linspace(0, len(indices) - 1, max(1, int(len(indices) / ratio))).astype(int)]
+        kept_opacity = 1 - (1 - opacity) ** (len(indices) / len(kept))
+        return self._edge_path(kept, rgb, kept_opacity, width)
+
+    def _bundle(self, indices, rgb, opacity) -> list:
+        """One filled band per pair of contiguous source and target groups."""
+        bands = []
+        labels = bundle_labels(self.source_index, self.target_index, self.bundle_groups)[indices]
+        for band in np.unique(labels):
+            members = indices[labels == band]
+            hull = convex_hull(np.vstack([self.starts[members], self.ends[members]])[:, :2])
+            if len(hull) < 3:
+                bands.append(self._edge_path(members, rgb, opacity, self.edge_widths[members[0]]))
+                continue
+            band_opacity = 1 - (1 - opacity) ** min(self.coverage(members), 50)
+            bands.append(
+                mn.Polygon(
+                    *np.column_stack([hull, np.zeros(len(hull))]),
+                    fill_color=mn.rgb_to_color(rgb),
+                    fill_opacity=band_opacity,
+                    stroke_width=0,
+                )
+            )
+        return bands
+
+    def _rebuild(self):
+        styles = np.round(
+            np.column_stack([self.edge_colors, self.edge_opacities, self.edge_widths]),
+            6,
+        )
+        unique_styles, inverse, counts = np.unique(
+            styles, axis=0, return_inverse=True, return_counts=True
+        )
+        inverse = inverse.reshape(-1)
+
+        # Largest buckets first so highlighted edges are drawn on top
+        paths = []
+        self._bucket_indices = []
+        for style_index in np.argsort(-counts, kind="stable"):
+            indices = np.flatnonzero(inverse == style_index)
+            rgb, (opacity,), (width,) = np.split(unique_styles[style_index], [3, 4])
+            mode = self.lod_mode(indices)
+            if mode == "full":
+                paths.append(self._edge_path(indices, rgb, opacity, width))
+                self._bucket_indices.append(indices)
+            elif mode == "subsample":
+                paths.append(self._subsample(indices, rgb, opacity, width))
+                self._bucket_indices.append(None)
+            else:
+                bands = self._bundle(indices, rgb, opacity)
+                paths.extend(bands)
+                self._bucket_indices.extend([None] * len(bands))
+
+        self.remove(*self.submobjects)
+        self.add(*paths)
+        self._reference_points = [path.points.copy() for path in paths]
+        return self
@@ -1,8 +1,12 @@
 import manim as mn
 import numpy as np
 
+from .cached_bounds import CachedBoundsMixin
+from .shared_copy import SharedCopyMixin
+from .text_cache import cached_text
 
-class DecisionBlock(mn.VGroup):
+
+class DecisionBlock(SharedCopyMixin, CachedBoundsMixin, mn.VGroup):
 
     def __init__(self, decision_text: str, fill_color, **kwargs):
         super().__init__(**kwargs)
@@ -12,12 +16,19 @@ class DecisionBlock(mn.VGroup):
             fill_opacity=1,
             stroke_color=mn.BLACK,
         ).rotate(mn.PI / 4)
-        text_block = mn.Text(decision_text, color=mn.BLACK)
+        text_block = cached_text(decision_text, color=mn.BLACK)
+        self.add(decision_box, self._fit_text(text_block, decision_box))
 
+    @staticmethod
+    def _fit_text(text_block, decision_box):
         max_size = decision_box.width / np.sqrt(2) * 0.9
 
         # Scale the text to fit
         scaling_factor = min(max_size / text_block.width, max_size / text_block.height)
-        text_block.scale(scaling_factor)
+        return text_block.scale(scaling_factor).move_to(decision_box)
 
-        self.add(decision_box, text_block)
+    def set_text(self, decision_text: str):
+        """Swap the question, keeping the block's current size and position."""
+        text_block = cached_text(decision_text, color=mn.BLACK)
+        self[1] = self._fit_text(text_block, self[0])
+        return self
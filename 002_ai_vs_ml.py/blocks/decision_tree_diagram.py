@@ -0,0 +1,91 @@
+import manim as mn
+import numpy as np
+
+from .decision_block import DecisionBlock
+from .arrow_batch import ArrowBatch
+from .cached_bounds import layout_pass
+from .input_block import InputBlock, OutputBlock
+from .tree_layout import preorder, tidy_tree_layout, tree_children, tree_parents
+from .tree_spec import TreeSpec
+
+
+class DecisionTreeDiagram(mn.VGroup):
+    """Input block plus a tidy-tree layout of ``DecisionBlock``/``OutputBlock`` nodes.
+
+    Node mobjects and their incoming arrows are created in a single pre-order pass,
+    so building scales linearly with the number of nodes.
+    """
+
+    def __init__(
+        self,
+        spec: TreeSpec,
+        input_text: str = "Input",
+        horizontal_spacing: float = 4.5,
+        vertical_spacing: float = 4,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.spec = spec
+        children = tree_children(spec.children_left, spec.children_right)
+        parents = tree_parents(children)
+        x, depth = tidy_tree_layout(children)
+
+        self.input_block = InputBlock(input_text)
+        self.input_block.move_to(mn.UP * vertical_spacing)
+        self.nodes = [None] * len(spec)
+        # arrows[i] points into node i; arrows[0] comes from the input block
+        starts = np.zeros((len(spec), 3))
+        ends = np.zeros((len(spec), 3))
+
+        # Blocks are only created and moved, so bounds are never recomputed from points
+        with layout_pass():
+            # Pre-order visits a parent before its children, so the parent block
+            # already exists when the arrow into a child is drawn
+            for node in preorder(children):
+                if spec.is_leaf(node):
+                    block = OutputBlock(spec.texts[node], fill_color=spec.colors[node])
+                else:
+                    block = DecisionBlock(spec.texts[node], spec.colors[node])
+                block.move_to(
+                    mn.RIGHT * x[node] * horizontal_spacing + mn.DOWN * depth[node] * vertical_spacing
+                )
+                self.nodes[node] = block
+
+                if node == 0:
+                    start = self.input_block.get_bottom()
+                else:
+                    parent = parents[node]
+                    siblings = children[parent]
+                    if len(siblings) == 1:
+                        start = self.nodes[parent].get_bottom()
+                    elif node == siblings[0]:
+                        start = self.nodes[parent].get_left()
+                    else:
+                        start = self.nodes[parent].get_right()
+                starts[node] = start
+                ends[node] = block.get_top()
+
+        self.arrow_batch = ArrowBatch(starts, ends)
+        self.arrows = self.arrow_batch.views()
+        self.add(self.input_block, self.arrow_batch, *self.nodes)
+
+    def path_animations(self, sample, color=mn.ORANGE) -> list:
+        """Animation steps highlighting the path of ``sample`` through the tree.
+
+        Each step is a list of animations meant for one ``Scene.play`` call.
+        """
+        steps = []
+        path = self.spec.decision_path(sample)
+        for node in path:
+            steps.append([self.arrows[node].animate.set_color(color)])
+            block = self.nodes[node]
+            if self.spec.is_leaf(node):
+                steps.append([block.animate.scale(1.5)])
+            else:
+                steps.append(
+                    [
+                        block[0].animate.set_fill(color),
+                        block[1].animate.set_color(mn.BLACK),
+                    ]
+                )
+        return steps
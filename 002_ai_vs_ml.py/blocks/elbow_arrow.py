@@ -1,10 +1,11 @@
 import manim as mn
-import numpy as np
+
+from .arrow_batch import elbow_control_points
 
 
 def create_elbow_arrow(start, end, angle=mn.TAU / 4):
-    midpoint = (start + end) / 2
-    control_point = midpoint + np.array([np.cos(angle), np.sin(angle), 0]) * 0.5
+    """Single arrow as a VGroup; use ``ArrowBatch`` for many arrows."""
+    control_point = elbow_control_points(start, end, angle)
 
     path = mn.CubicBezier(start, start, control_point, end)
 
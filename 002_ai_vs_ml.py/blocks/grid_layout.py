@@ -0,0 +1,33 @@
+import math
+
+import numpy as np
+
+
+def calculate_grid_layout(n_items, item_width, item_height, frame_width, frame_height, buff=1, margin=0.9):
+    """
+    Pick the grid shape that fits equally sized items into the frame at the largest scale.
+
+    Returns:
+    tuple: (rows, cols, scale_factor)
+    """
+    best = None
+    for cols in range(1, n_items + 1):
+        rows = math.ceil(n_items / cols)
+        width = cols * item_width + (cols - 1) * buff
+        height = rows * item_height + (rows - 1) * buff
+        scale_factor = min(
+            (frame_width * margin) / width,
+            (frame_height * margin) / height,
+        )
+        if best is None or scale_factor > best[2]:
+            best = (rows, cols, scale_factor)
+    return best
+
+
+def grid_offsets(n_items, rows, cols, cell_width, cell_height) -> np.ndarray:
+    """(n_items, 3) cell centres of a row-major grid, relative to the grid centre."""
+    row, col = np.divmod(np.arange(n_items), cols)
+    offsets = np.zeros((n_items, 3))
+    offsets[:, 0] = (col - (cols - 1) / 2) * cell_width
+    offsets[:, 1] = ((rows - 1) / 2 - row) * cell_height
+    return offsets
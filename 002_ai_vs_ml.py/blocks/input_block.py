@@ -1,7 +1,11 @@
 import manim as mn
 
+from .cached_bounds import CachedBoundsMixin
+from .shared_copy import SharedCopyMixin
+from .text_cache import cached_text
 
-class InputBlock(mn.VGroup):
+
+class InputBlock(SharedCopyMixin, CachedBoundsMixin, mn.VGroup):
     def __init__(self, input_text: str, fill_color=mn.LIGHT_GREY, **kwargs):
         super().__init__(**kwargs)
         input_box = mn.RoundedRectangle(
@@ -12,9 +16,22 @@ class InputBlock(mn.VGroup):
             fill_opacity=1,
             stroke_color=mn.BLACK,
         )
-        input_block = mn.Text(input_text, color=mn.BLACK)
+        input_block = cached_text(input_text, color=mn.BLACK)
+        self._box_width = input_box.width
         self.add(input_box, input_block)
 
+    @property
+    def scale_ratio(self) -> float:
+        """Current size of the block relative to when it was created."""
+        return self[0].width / self._box_width
+
+    def set_text(self, input_text: str):
+        """Swap the label, keeping the block's current size and position."""
+        text_block = cached_text(input_text, color=mn.BLACK)
+        text_block.scale(self.scale_ratio).move_to(self[0])
+        self[1] = text_block
+        return self
+
 
 class OutputBlock(InputBlock):
     def __init__(self, input_text, fill_color=mn.LIGHT_GREY, **kwargs):
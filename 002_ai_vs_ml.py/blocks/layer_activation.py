@@ -0,0 +1,126 @@
+import manim as mn
+import numpy as np
+
+
+def isolate_layer(layer) -> None:
+    """Give every neuron of a compact layer its own path while it is animated."""
+    if layer.compact:
+        layer.neuron_array._isolate(np.arange(layer.neuron_array.n_neurons))
+
+
+def release_layer(layer) -> None:
+    if layer.compact:
+        layer.neuron_array._release(np.arange(layer.neuron_array.n_neurons))
+
+
+def set_layer_opacities(layer, opacities) -> None:
+    """Write fill and stroke opacities of every neuron of a layer in place.
+
+    Compact layers must be isolated with ``isolate_layer`` for the duration.
+    """
+    if layer.compact:
+        array = layer.neuron_array
+        array.opacities[:] = opacities
+        array._redraw_isolated(np.arange(array.n_neurons), resize=False)
+        return
+    for neuron, opacity in zip(layer.neurons, opacities):
+        neuron.fill_rgbas[:, 3] = opacity
+        neuron.stroke_rgbas[:, 3] = opacity
+
+
+class LayerActivation(mn.Animation):
+    """Fade every neuron of a layer to its activation in one in-place update.
+
+    Fill and stroke opacities are interpolated from their values at ``begin``
+    towards ``activations`` without copying the layer or any neuron.
+    """
+
+    def __init__(self, layer, activations, **kwargs):
+        self.layer = layer
+        self.target = np.asarray(activations, dtype=float).reshape(-1)
+        if len(self.target) != len(layer.neurons):
+            raise ValueError("Expected one activation per neuron")
+        super().__init__(layer, **kwargs)
+
+    def create_starting_mobject(self):
+        return self.mobject
+
+    def begin(self) -> None:
+        isolate_layer(self.layer)
+        if self.layer.compact:
+            self.start = self.layer.neuron_array.opacities.copy()
+        else:
+            self.start = np.array(
+                [neuron.get_fill_opacity() for neuron in self.layer.neurons]
+            )
+        super().begin()
+
+    def finish(self) -> None:
+        super().finish()
+        release_layer(self.layer)
+        self.layer.activations[:] = self.target
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        set_layer_opacities(
+            self.layer, mn.interpolate(self.start, self.target, self.rate_func(alpha))
+        )
+
+
+class _SampleCursor:
+    """Shared position in a stream of samples, pulled lazily and never rewound."""
+
+    def __init__(self, samples):
+        self.samples = iter(samples)
+        self.index = -1
+        self.current = None
+
+    def at(self, index: int):
+        # Frames may skip samples at low frame rates, only the latest one is kept
+        while self.index < index:
+            self.current = next(self.samples)
+            self.index += 1
+        return self.current
+
+
+class ActivationStream(mn.Animation):
+    """Show a stream of samples, one after another, on one layer of a stack.
+
+    ``samples`` yields one tuple of activation vectors per sample, one vector
+    per layer, e.g. ``NetworkModel.stream``. ``for_layers`` builds one
+    animation per layer sharing a single pass over the samples, which are
+    pulled lazily as the animations advance and written into the layers in
+    place, so memory does not grow with the number of samples. Each animation
+    runs on its own layer, so playing them adds nothing new to the scene.
+    """
+
+    def __init__(self, layer, layer_index: int, samples, n_samples: int, **kwargs):
+        self.layer = layer
+        self.layer_index = layer_index
+        self.samples = samples if isinstance(samples, _SampleCursor) else _SampleCursor(samples)
+        self.n_samples = n_samples
+        kwargs.setdefault("run_time", n_samples / 10)
+        kwargs.setdefault("rate_func", mn.linear)
+        super().__init__(layer, **kwargs)
+
+    @classmethod
+    def for_layers(cls, layers, samples, n_samples: int, **kwargs) -> list:
+        """One animation per layer, all reading the same stream of samples."""
+        cursor = _SampleCursor(samples)
+        return [cls(layer, i, cursor, n_samples, **kwargs) for i, layer in enumerate(layers)]
+
+    def create_starting_mobject(self):
+        return self.mobject
+
+    def begin(self) -> None:
+        isolate_layer(self.layer)
+        super().begin()
+
+    def finish(self) -> None:
+        super().finish()
+        release_layer(self.layer)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        index = min(int(self.rate_func(alpha) * self.n_samples), self.n_samples - 1)
+        values = self.samples.at(index)[self.layer_index]
+        set_layer_opacities(self.layer, values)
+        self.layer.activations[:] = values
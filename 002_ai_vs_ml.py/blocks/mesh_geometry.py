@@ -0,0 +1,50 @@
+import numpy as np
+
+
+def convex_hull(points: np.ndarray) -> np.ndarray:
+    """Counter-clockwise hull of (N, 2) points, Andrew's monotone chain."""
+    points = np.unique(points, axis=0)
+    if len(points) < 3:
+        return points
+
+    def half_hull(ordered):
+        hull = []
+        for point in ordered:
+            while len(hull) >= 2:
+                (ax, ay), (bx, by) = hull[-1] - hull[-2], point - hull[-2]
+                if ax * by - ay * bx > 0:
+                    break
+                hull.pop()
+            hull.append(point)
+        return hull[:-1]
+
+    return np.array(half_hull(points) + half_hull(points[::-1]))
+
+
+def polygon_area(vertices: np.ndarray) -> float:
+    x, y = vertices[:, 0], vertices[:, 1]
+    return 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+def complete_bipartite(sources, targets):
+    """Edges from every source point to every target point, source-major.
+
+    Returns ``(starts, ends, source_index, target_index)``.
+    """
+    sources = np.array(sources, dtype=float).reshape(-1, 3)
+    targets = np.array(targets, dtype=float).reshape(-1, 3)
+    return (
+        np.repeat(sources, len(targets), axis=0),
+        np.tile(targets, (len(sources), 1)),
+        np.repeat(np.arange(len(sources)), len(targets)),
+        np.tile(np.arange(len(targets)), len(sources)),
+    )
+
+
+def bundle_labels(source_index, target_index, groups: int) -> np.ndarray:
+    """Band of every edge: contiguous source group times ``groups`` plus target group."""
+    source_index = np.asarray(source_index)
+    target_index = np.asarray(target_index)
+    source_group = source_index * groups // (source_index.max() + 1)
+    target_group = target_index * groups // (target_index.max() + 1)
+    return source_group * groups + target_group
@@ -0,0 +1,306 @@
+from collections.abc import Sequence
+
+import manim as mn
+import numpy as np
+
+
+def _unit_circle_points(n_segments: int = 8) -> np.ndarray:
+    """Cubic Bezier points of a unit circle, shape (4 * n_segments, 3)."""
+    angles = np.linspace(0, mn.TAU, n_segments + 1)
+    handle = 4 / 3 * np.tan(mn.TAU / n_segments / 4)
+    anchors = np.column_stack([np.cos(angles), np.sin(angles), np.zeros_like(angles)])
+    tangents = np.column_stack([-np.sin(angles), np.cos(angles), np.zeros_like(angles)])
+    curves = np.stack(
+        [
+            anchors[:-1],
+            anchors[:-1] + handle * tangents[:-1],
+            anchors[1:] - handle * tangents[1:],
+            anchors[1:],
+        ],
+        axis=1,
+    )
+    return curves.reshape(-1, 3)
+
+
+UNIT_CIRCLE = _unit_circle_points()
+
+
+class NeuronArray(mn.VGroup):
+    """Many round neurons kept as NumPy arrays and drawn as a few mobjects.
+
+    Centres, radii, fill colours, opacities and activations are (N, ...) arrays.
+    Neurons with the same (quantized) style are drawn as one VMobject with one
+    circular subpath each, so the mobject count does not grow with N. Neurons
+    being animated are isolated in their own path for the duration of the play,
+    so the animation can restyle them without replacing any submobject.
+    """
+
+    def __init__(self, centers, colors=mn.WHITE, radius: float = 1.0, **kwargs):
+        super().__init__(**kwargs)
+        self.centers = np.array(centers, dtype=float).reshape(-1, 3)
+        n_neurons = len(self.centers)
+
+        if isinstance(colors, (list, tuple)):
+            self.colors = np.array([mn.color_to_rgb(color) for color in colors])
+        else:
+            self.colors = np.tile(mn.color_to_rgb(colors), (n_neurons, 1))
+        self.radii = np.full(n_neurons, radius, dtype=float)
+        self.opacities = np.ones(n_neurons)
+        self.activations = np.zeros(n_neurons)
+        self._bucket_indices = []
+        # Point arrays of the drawn paths at the last sync; manim rebinds them on transforms
+        self._synced_points = []
+        # Per neuron: number of running animations isolating it, and its path index
+        self._isolated = np.zeros(n_neurons, dtype=int)
+        self._path_of = np.full(n_neurons, -1)
+
+        self._rebuild()
+
+    @classmethod
+    def in_row(cls, n_neurons: int, colors=mn.WHITE, radius: float = 1.0, buff: float = 1.0):
+        """Neurons spaced like ``VGroup(*dots).arrange(RIGHT, buff=buff)``."""
+        centers = np.zeros((n_neurons, 3))
+        centers[:, 0] = (np.arange(n_neurons) - (n_neurons - 1) / 2) * (2 * radius + buff)
+        return cls(centers, colors=colors, radius=radius)
+
+    @property
+    def n_neurons(self) -> int:
+        return len(self.centers)
+
+    def views(self) -> "NeuronViews":
+        return NeuronViews(self)
+
+    def get_centers(self) -> np.ndarray:
+        self._sync_from_points()
+        return self.centers
+
+    def restyle(self, indices, color=None, opacity=None, scale_factor=None):
+        """Change colour, opacity and/or size of the given neurons in place."""
+        self._sync_from_points()
+        if color is not None:
+            self.colors[indices] = mn.color_to_rgb(color)
+        if opacity is not None:
+            self.opacities[indices] = opacity
+        if scale_factor is not None:
+            self.radii[indices] *= scale_factor
+        return self._rebuild()
+
+    def animate_neurons(self, indices) -> "NeuronAnimation":
+        """Animation builder for a subset of neurons, used like ``.animate``."""
+        return NeuronAnimation(self, indices)
+
+    def _sync_from_points(self):
+        # Pick up shifts/scales applied to the drawn paths since the last rebuild
+        drawn = [path.points for path in self.submobjects]
+        if len(drawn) == len(self._synced_points) and all(
+            a is b for a, b in zip(drawn, self._synced_points)
+        ):
+            return
+        self._synced_points = drawn
+        n_points = len(UNIT_CIRCLE)
+        for path, indices in zip(self.submobjects, self._bucket_indices):
+            if len(path.points) != n_points * len(indices):
+                continue
+            circles = path.points.reshape(-1, n_points, 3)
+            self.centers[indices] = circles.mean(axis=1)
+            self.radii[indices] = np.linalg.norm(
+                circles[:, 0] - self.centers[indices], axis=1
+            )
+
+    def _isolate(self, indices):
+        """Draw the given neurons one path each until they are released."""
+        self._sync_from_points()
+        np.add.at(self._isolated, indices, 1)
+        return self._rebuild()
+
+    def _release(self, indices):
+        self._sync_from_points()
+        np.subtract.at(self._isolated, indices, 1)
+        return self._rebuild()
+
+    def _redraw_isolated(self, indices, resize: bool = True):
+        """Write the styles of isolated neurons into their own paths."""
+        indices = np.atleast_1d(indices)
+        if np.any(self._isolated[indices] == 0):
+            return self._rebuild()
+        for index in indices:
+            path = self.submobjects[self._path_of[index]]
+            path.fill_rgbas[:, :3] = self.colors[index]
+            path.fill_rgbas[:, 3] = self.opacities[index]
+            if resize:
+                # Rebinding the points keeps the bounds caches of the parents honest
+                path.set_points(self.centers[index] + self.radii[index] * UNIT_CIRCLE)
+        if resize:
+            self._synced_points = [path.points for path in self.submobjects]
+        return self
+
+    def _rebuild(self):
+        # Quantize styles so animated opacities do not explode the bucket count;
+        # isolated neurons get a key of their own
+        styles = np.column_stack(
+            [
+                np.round(self.colors * 255),
+                np.round(self.opacities * 100),
+                np.where(self._isolated > 0, np.arange(self.n_neurons), -1),
+            ]
+        )
+        unique_styles, inverse = np.unique(styles, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+
+        paths = []
+        self._bucket_indices = []
+        for style_index, style in enumerate(unique_styles):
+            indices = np.flatnonzero(inverse == style_index)
+            self._path_of[indices] = len(paths)
+            circles = (
+                self.centers[indices, None, :]
+                + self.radii[indices, None, None] * UNIT_CIRCLE[None, :, :]
+            )
+            path = mn.VMobject(
+                fill_color=mn.rgb_to_color(style[:3] / 255),
+                fill_opacity=style[3] / 100,
+                stroke_width=0,
+            )
+            path.set_points(circles.reshape(-1, 3))
+            paths.append(path)
+            self._bucket_indices.append(indices)
+
+        self.remove(*self.submobjects)
+        self.add(*paths)
+        self._synced_points = [path.points for path in paths]
+        return self
+
+
+class NeuronView:
+    """Lightweight handle to one neuron of a ``NeuronArray``, with a Dot-like API."""
+
+    __slots__ = ("array", "index")
+
+    def __init__(self, array: NeuronArray, index: int):
+        self.array = array
+        self.index = index
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, NeuronView)
+            and other.array is self.array
+            and other.index == self.index
+        )
+
+    def __hash__(self):
+        return hash((id(self.array), self.index))
+
+    def __repr__(self):
+        return f"NeuronView({self.index})"
+
+    @property
+    def activation(self) -> float:
+        return self.array.activations[self.index]
+
+    def get_center(self) -> np.ndarray:
+        return self.array.get_centers()[self.index].copy()
+
+    def set_color(self, color):
+        self.array.restyle(self.index, color=color)
+        return self
+
+    def set_fill(self, color=None, opacity=None):
+        self.array.restyle(self.index, color=color, opacity=opacity)
+        return self
+
+    def set_opacity(self, opacity):
+        self.array.restyle(self.index, opacity=opacity)
+        return self
+
+    def scale(self, scale_factor):
+        self.array.restyle(self.index, scale_factor=scale_factor)
+        return self
+
+    @property
+    def animate(self) -> "NeuronAnimation":
+        return NeuronAnimation(self.array, [self.index])
+
+
+class NeuronViews(Sequence):
+    """Read-only sequence of ``NeuronView``s standing in for a VGroup of Dots."""
+
+    def __init__(self, array: NeuronArray):
+        self.array = array
+
+    def __len__(self):
+        return self.array.n_neurons
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [NeuronView(self.array, i) for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("neuron index out of range")
+        return NeuronView(self.array, index)
+
+
+class NeuronAnimation(mn.Animation):
+    """Interpolate colour, opacity and size of some neurons without copying the array.
+
+    Style calls (``set_color``, ``set_fill``, ``set_opacity``, ``scale``) record the
+    target state and return the animation, mirroring ``mobject.animate``.
+    """
+
+    def __init__(self, array: NeuronArray, indices, **kwargs):
+        array._sync_from_points()
+        self.indices = np.asarray(indices, dtype=int)
+        self.target_colors = array.colors[self.indices].copy()
+        self.target_opacities = array.opacities[self.indices].copy()
+        self.target_radii = array.radii[self.indices].copy()
+        super().__init__(array, **kwargs)
+
+    def set_color(self, color):
+        self.target_colors[:] = mn.color_to_rgb(color)
+        return self
+
+    def set_fill(self, color=None, opacity=None):
+        if color is not None:
+            self.set_color(color)
+        if opacity is not None:
+            self.set_opacity(opacity)
+        return self
+
+    def set_opacity(self, opacity):
+        self.target_opacities[:] = opacity
+        return self
+
+    def scale(self, scale_factor):
+        self.target_radii *= scale_factor
+        return self
+
+    def create_starting_mobject(self):
+        return self.mobject
+
+    def begin(self) -> None:
+        # The scene collects the moving submobjects after begin, so they must not change later
+        array = self.mobject
+        array._isolate(self.indices)
+        self.start_colors = array.colors[self.indices].copy()
+        self.start_opacities = array.opacities[self.indices].copy()
+        self.start_radii = array.radii[self.indices].copy()
+        self.resizes = not np.array_equal(self.start_radii, self.target_radii)
+        super().begin()
+
+    def finish(self) -> None:
+        super().finish()
+        self.mobject._release(self.indices)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        array = self.mobject
+        array.colors[self.indices] = mn.interpolate(
+            self.start_colors, self.target_colors, alpha
+        )
+        array.opacities[self.indices] = mn.interpolate(
+            self.start_opacities, self.target_opacities, alpha
+        )
+        array.radii[self.indices] = mn.interpolate(
+            self.start_radii, self.target_radii, alpha
+        )
+        array._redraw_isolated(self.indices, resize=self.resizes)
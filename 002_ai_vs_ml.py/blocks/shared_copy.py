@@ -0,0 +1,112 @@
+import copy
+
+import manim as mn
+import numpy as np
+
+# Arrays holding the geometry and style of a mobject, the bulk of a copy
+SHARED_ARRAY_ATTRS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+
+
+class SharedArray(np.ndarray):
+    """Array shared between a mobject and its shared copies.
+
+    Manim moves points with augmented assignments like ``mob.points -= v``,
+    also from ancestors that know nothing about sharing. Those return a new
+    plain array here, which the assignment binds to that one mobject only.
+    Results of arithmetic and copies are plain arrays too; views stay shared.
+    """
+
+    def __array_ufunc__(self, ufunc, method, *inputs, out=None, **kwargs):
+        if out is not None:
+            kwargs["out"] = tuple(map(_plain, out))
+        return getattr(ufunc, method)(*map(_plain, inputs), **kwargs)
+
+    def __iadd__(self, other):
+        return np.add(self, other)
+
+    def __isub__(self, other):
+        return np.subtract(self, other)
+
+    def __imul__(self, other):
+        return np.multiply(self, other)
+
+    def __itruediv__(self, other):
+        return np.true_divide(self, other)
+
+    def astype(self, *args, **kwargs):
+        return np.asarray(self).astype(*args, **kwargs)
+
+    def copy(self, *args, **kwargs):
+        return np.asarray(self).copy(*args, **kwargs)
+
+
+def _plain(value):
+    return np.asarray(value) if isinstance(value, SharedArray) else value
+
+
+def _own(mob, attr: str) -> None:
+    """Give ``mob`` a private copy of ``attr`` if it still shares it with a copy."""
+    array = mob.__dict__.get(attr)
+    if isinstance(array, SharedArray):
+        setattr(mob, attr, np.array(array))
+
+
+class _CopyOnWrite:
+    """Mixed into the members of shared copies; owns an array before writing into it."""
+
+    def update_rgbas_array(self, array_name, *args, **kwargs):
+        _own(self, array_name)
+        return super().update_rgbas_array(array_name, *args, **kwargs)
+
+    def pointwise_become_partial(self, *args, **kwargs):
+        _own(self, "points")
+        return super().pointwise_become_partial(*args, **kwargs)
+
+
+_copy_on_write_classes = {}
+
+
+def _copy_on_write_class(cls):
+    if issubclass(cls, _CopyOnWrite):
+        return cls
+    if cls not in _copy_on_write_classes:
+        _copy_on_write_classes[cls] = type(
+            cls.__name__,
+            (_CopyOnWrite, cls),
+            {"__qualname__": cls.__qualname__, "__module__": cls.__module__},
+        )
+    return _copy_on_write_classes[cls]
+
+
+def shared_copy(mob):
+    """Copy of ``mob`` whose family shares its point and colour arrays with ``mob``.
+
+    Only the two families change: their arrays become ``SharedArray`` views and
+    their vectorized members write in place only after copying the array.
+    """
+    memo = {}
+    for member in mob.get_family():
+        if not isinstance(member, mn.VMobject):
+            continue
+        member.__class__ = _copy_on_write_class(type(member))
+        for attr in SHARED_ARRAY_ATTRS:
+            array = member.__dict__.get(attr)
+            if isinstance(array, np.ndarray):
+                if not isinstance(array, SharedArray):
+                    array = array.view(SharedArray)
+                    setattr(member, attr, array)
+                # deepcopy returns memo entries as they are
+                memo[id(array)] = array
+    return copy.deepcopy(mob, memo)
+
+
+class SharedCopyMixin:
+    """``copy()`` shares point and colour arrays until one side changes them.
+
+    ``.animate`` targets and the starting copies made by ``Transform`` go through
+    ``copy()``, so they share all geometry the animation does not touch. Must
+    come before the Mobject in the bases.
+    """
+
+    def copy(self):
+        return shared_copy(self)
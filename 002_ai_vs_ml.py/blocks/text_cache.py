@@ -0,0 +1,135 @@
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+
+import manim as mn
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class TextCache:
+    """LRU cache of shaped ``mn.Text`` mobjects keyed on (text, font, font_size, color).
+
+    ``get`` returns a copy of the cached glyph geometry, so callers can move,
+    scale and recolor the result freely. With ``persist_dir`` every shaped text
+    is also written there as plain numpy arrays, one ``.npz`` file per key, so
+    later renders skip Pango shaping and SVG parsing altogether. Entries read
+    back from disk are rebuilt as a ``VGroup`` of glyphs rather than a ``Text``.
+    """
+
+    def __init__(self, maxsize: int = 1024, persist_dir: str = None):
+        self.maxsize = maxsize
+        self.persist_dir = persist_dir
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(text: str, font: str, font_size: float, color) -> tuple:
+        return (text, font, float(font_size), mn.ManimColor(color).to_hex(with_alpha=True))
+
+    def get(
+        self,
+        text: str,
+        font: str = "",
+        font_size: float = mn.DEFAULT_FONT_SIZE,
+        color=mn.WHITE,
+    ) -> mn.VMobject:
+        key = self.make_key(text, font, font_size, color)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = self.load(key)
+            if entry is None:
+                entry = mn.Text(text, font=font, font_size=font_size, color=color)
+                self.save(key, entry)
+            self._entries[key] = entry
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return entry.copy()
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def entry_path(self, key: tuple) -> str:
+        digest = hashlib.sha256(repr((mn.__version__, key)).encode()).hexdigest()
+        return os.path.join(self.persist_dir, f"{digest}.npz")
+
+    def save(self, key: tuple, entry: mn.VMobject):
+        if not self.persist_dir:
+            return
+        glyphs = entry.family_members_with_points()
+        os.makedirs(self.persist_dir, exist_ok=True)
+        # Write next to the final name first so readers never see half a file
+        path = self.entry_path(key)
+        partial = f"{path}.{os.getpid()}.partial"
+        with open(partial, "wb") as file:
+            np.savez(
+                file,
+                key=np.array([repr(key)]),
+                points=np.concatenate([glyph.points for glyph in glyphs] or [np.zeros((0, 3))]),
+                counts=np.array([len(glyph.points) for glyph in glyphs], dtype=int),
+                fill_rgbas=np.array([glyph.fill_rgbas[0] for glyph in glyphs]).reshape(-1, 4),
+                stroke_rgbas=np.array([glyph.stroke_rgbas[0] for glyph in glyphs]).reshape(-1, 4),
+                stroke_widths=np.array([glyph.stroke_width for glyph in glyphs], dtype=float),
+            )
+        os.replace(partial, path)
+
+    def load(self, key: tuple):
+        """The glyphs stored for ``key`` in ``persist_dir``, or None."""
+        if not self.persist_dir:
+            return None
+        path = self.entry_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as arrays:
+                if arrays["key"][0] != repr(key):
+                    return None
+                counts = arrays["counts"]
+                points = np.split(arrays["points"], np.cumsum(counts)[:-1])
+                fill_rgbas = arrays["fill_rgbas"]
+                stroke_rgbas = arrays["stroke_rgbas"]
+                stroke_widths = arrays["stroke_widths"]
+        except (OSError, ValueError, KeyError, IndexError) as error:
+            logger.warning("Ignoring unreadable text cache entry %s: %s", path, error)
+            return None
+
+        glyphs = []
+        for glyph_points, fill, stroke, stroke_width in zip(
+            points, fill_rgbas, stroke_rgbas, stroke_widths
+        ):
+            glyph = mn.VMobject(stroke_width=stroke_width)
+            glyph.set_points(glyph_points)
+            glyph.fill_rgbas = fill.reshape(1, 4).copy()
+            glyph.stroke_rgbas = stroke.reshape(1, 4).copy()
+            glyphs.append(glyph)
+        return mn.VGroup(*glyphs)
+
+
+TEXT_CACHE = TextCache(persist_dir=os.environ.get("MANIM_TEXT_CACHE"))
+
+
+def cached_text(
+    text: str, font: str = "", font_size: float = mn.DEFAULT_FONT_SIZE, color=mn.WHITE
+) -> mn.VMobject:
+    """Drop-in for ``mn.Text`` backed by the process-wide ``TEXT_CACHE``."""
+    return TEXT_CACHE.get(text, font=font, font_size=font_size, color=color)
@@ -0,0 +1,152 @@
+import numpy as np
+
+
+def tree_children(children_left, children_right) -> list:
+    """Per-node child lists from scikit-learn style child arrays (-1 means none)."""
+    return [
+        [child for child in (left, right) if child >= 0]
+        for left, right in zip(children_left, children_right)
+    ]
+
+
+def tree_parents(children: list) -> np.ndarray:
+    parent = np.full(len(children), -1)
+    for node, kids in enumerate(children):
+        parent[kids] = node
+    return parent
+
+
+def preorder(children: list, root: int = 0) -> list:
+    order = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        stack.extend(reversed(children[node]))
+    return order
+
+
+def tidy_tree_layout(children: list, root: int = 0, distance: float = 1.0):
+    """Reingold-Tilford tidy tree layout in linear time.
+
+    Uses the Buchheim, Jünger and Leipert formulation of Walker's algorithm,
+    with both walks done iteratively so deep trees do not hit the recursion limit.
+
+    Args:
+        children (list): ``children[i]`` lists the children of node ``i`` left to right.
+        root (int): Index of the root node.
+        distance (float): Minimum horizontal distance between neighbouring nodes.
+
+    Returns:
+        tuple: (x, depth) arrays indexed by node, with the root at x == 0.
+    """
+    n_nodes = len(children)
+    parent = tree_parents(children)
+    number = np.zeros(n_nodes, dtype=int)
+    for kids in children:
+        number[kids] = np.arange(1, len(kids) + 1)
+
+    prelim = np.zeros(n_nodes)
+    mod = np.zeros(n_nodes)
+    change = np.zeros(n_nodes)
+    shift = np.zeros(n_nodes)
+    midpoint = np.zeros(n_nodes)
+    thread = np.full(n_nodes, -1)
+    ancestor = np.arange(n_nodes)
+
+    def left_sibling(node):
+        if parent[node] < 0 or number[node] == 1:
+            return -1
+        return children[parent[node]][number[node] - 2]
+
+    def next_left(node):
+        return children[node][0] if children[node] else thread[node]
+
+    def next_right(node):
+        return children[node][-1] if children[node] else thread[node]
+
+    def place(node):
+        sibling = left_sibling(node)
+        if sibling < 0:
+            prelim[node] = midpoint[node]
+        else:
+            prelim[node] = prelim[sibling] + distance
+            if children[node]:
+                mod[node] = prelim[node] - midpoint[node]
+
+    def move_subtree(left, right, amount):
+        subtrees = number[right] - number[left]
+        change[right] -= amount / subtrees
+        shift[right] += amount
+        change[left] += amount / subtrees
+        prelim[right] += amount
+        mod[right] += amount
+
+    def apportion(node, default_ancestor):
+        sibling = left_sibling(node)
+        if sibling < 0:
+            return default_ancestor
+        v_in_right = v_out_right = node
+        v_in_left = sibling
+        v_out_left = children[parent[node]][0]
+        s_in_right = mod[v_in_right]
+        s_out_right = mod[v_out_right]
+        s_in_left = mod[v_in_left]
+        s_out_left = mod[v_out_left]
+        while next_right(v_in_left) >= 0 and next_left(v_in_right) >= 0:
+            v_in_left = next_right(v_in_left)
+            v_in_right = next_left(v_in_right)
+            v_out_left = next_left(v_out_left)
+            v_out_right = next_right(v_out_right)
+            ancestor[v_out_right] = node
+            gap = (prelim[v_in_left] + s_in_left) - (prelim[v_in_right] + s_in_right) + distance
+            if gap > 0:
+                candidate = ancestor[v_in_left]
+                if parent[candidate] != parent[node]:
+                    candidate = default_ancestor
+                move_subtree(candidate, node, gap)
+                s_in_right += gap
+                s_out_right += gap
+            s_in_left += mod[v_in_left]
+            s_in_right += mod[v_in_right]
+            s_out_left += mod[v_out_left]
+            s_out_right += mod[v_out_right]
+        if next_right(v_in_left) >= 0 and next_right(v_out_right) < 0:
+            thread[v_out_right] = next_right(v_in_left)
+            mod[v_out_right] += s_in_left - s_out_right
+        if next_left(v_in_right) >= 0 and next_left(v_out_left) < 0:
+            thread[v_out_left] = next_left(v_in_right)
+            mod[v_out_left] += s_in_right - s_out_left
+            default_ancestor = node
+        return default_ancestor
+
+    # First walk in post-order; each node places and apportions its children
+    order = preorder(children, root)
+    for node in reversed(order):
+        kids = children[node]
+        if not kids:
+            continue
+        default_ancestor = kids[0]
+        for child in kids:
+            place(child)
+            default_ancestor = apportion(child, default_ancestor)
+        total_shift = total_change = 0.0
+        for child in reversed(kids):
+            prelim[child] += total_shift
+            mod[child] += total_shift
+            total_change += change[child]
+            total_shift += shift[child] + total_change
+        midpoint[node] = (prelim[kids[0]] + prelim[kids[-1]]) / 2
+    place(root)
+
+    # Second walk in pre-order accumulates the modifiers down the tree
+    x = np.zeros(n_nodes)
+    depth = np.zeros(n_nodes, dtype=int)
+    stack = [(root, -prelim[root], 0)]
+    while stack:
+        node, offset, level = stack.pop()
+        x[node] = prelim[node] + offset
+        depth[node] = level
+        for child in children[node]:
+            stack.append((child, offset + mod[node], level + 1))
+    return x, depth
@@ -0,0 +1,124 @@
+import numpy as np
+
+# Hex values of manim's RED, GREEN, ORANGE, PURPLE, TEAL, PINK and GOLD
+LEAF_COLORS = ["#FC6255", "#83C167", "#FF862F", "#9A72AC", "#5CD0B3", "#D147BD", "#F0AC5F"]
+# manim's LIGHT_GREY
+DECISION_COLOR = "#BBBBBB"
+
+
+class TreeSpec:
+    """Binary decision tree in scikit-learn ``tree_`` array form plus display text.
+
+    A node ``i`` is a leaf when ``children_left[i] == -1``. A sample goes left
+    when ``sample[feature[i]] <= threshold[i]``.
+    """
+
+    def __init__(self, children_left, children_right, feature, threshold, texts, colors):
+        self.children_left = np.asarray(children_left, dtype=int)
+        self.children_right = np.asarray(children_right, dtype=int)
+        self.feature = np.asarray(feature, dtype=int)
+        self.threshold = np.asarray(threshold, dtype=float)
+        self.texts = list(texts)
+        self.colors = list(colors)
+
+    def __len__(self):
+        return len(self.children_left)
+
+    def is_leaf(self, node: int) -> bool:
+        return self.children_left[node] < 0
+
+    @classmethod
+    def from_dict(cls, spec: dict, decision_color=DECISION_COLOR):
+        """Build from nested dicts, e.g. parsed JSON.
+
+        Decision nodes look like ``{"question": str, "feature": int, "threshold": float,
+        "left": {...}, "right": {...}}``; leaves look like ``{"label": str}`` with an
+        optional ``"color"``. Leaves without a colour get one per distinct label.
+        """
+        children_left, children_right, feature, threshold, texts, colors = [], [], [], [], [], []
+        label_colors = {}
+        stack = [(spec, -1, None)]
+        while stack:
+            node_spec, parent, side = stack.pop()
+            node = len(texts)
+            if parent >= 0:
+                (children_left if side == "left" else children_right)[parent] = node
+            children_left.append(-1)
+            children_right.append(-1)
+            if "label" in node_spec:
+                label = node_spec["label"]
+                label_colors.setdefault(label, LEAF_COLORS[len(label_colors) % len(LEAF_COLORS)])
+                feature.append(-2)
+                threshold.append(-2.0)
+                texts.append(label)
+                colors.append(node_spec.get("color", label_colors[label]))
+                continue
+            feature.append(node_spec["feature"])
+            threshold.append(node_spec["threshold"])
+            texts.append(node_spec["question"])
+            colors.append(node_spec.get("color", decision_color))
+            stack.append((node_spec["right"], node, "right"))
+            stack.append((node_spec["left"], node, "left"))
+        return cls(children_left, children_right, feature, threshold, texts, colors)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        children_left,
+        children_right,
+        feature,
+        threshold,
+        value,
+        feature_names=None,
+        class_names=None,
+        decision_color=DECISION_COLOR,
+    ):
+        """Build from arrays shaped like a fitted scikit-learn ``tree_``.
+
+        ``value`` has one row of class counts per node (extra singleton axes are
+        squeezed), and leaves are labelled with their majority class.
+        """
+        value = np.asarray(value, dtype=float).reshape(len(children_left), -1)
+        n_classes = value.shape[1]
+        if class_names is None:
+            class_names = [f"class {i}" for i in range(n_classes)]
+        texts, colors = [], []
+        for node in range(len(children_left)):
+            if children_left[node] < 0:
+                winner = int(np.argmax(value[node]))
+                texts.append(str(class_names[winner]))
+                colors.append(LEAF_COLORS[winner % len(LEAF_COLORS)])
+                continue
+            name = feature_names[feature[node]] if feature_names is not None else f"x[{feature[node]}]"
+            texts.append(f"{name} <= {threshold[node]:.2f}")
+            colors.append(decision_color)
+        return cls(children_left, children_right, feature, threshold, texts, colors)
+
+    @classmethod
+    def from_sklearn(cls, estimator, feature_names=None, class_names=None, **kwargs):
+        """Build from a fitted ``DecisionTreeClassifier``."""
+        tree = estimator.tree_
+        if class_names is None and hasattr(estimator, "classes_"):
+            class_names = [str(name) for name in estimator.classes_]
+        return cls.from_arrays(
+            tree.children_left,
+            tree.children_right,
+            tree.feature,
+            tree.threshold,
+            tree.value,
+            feature_names=feature_names,
+            class_names=class_names,
+            **kwargs,
+        )
+
+    def decision_path(self, sample) -> list:
+        """Node indices visited by ``sample``, root first."""
+        node = 0
+        path = [node]
+        while not self.is_leaf(node):
+            if sample[self.feature[node]] <= self.threshold[node]:
+                node = self.children_left[node]
+            else:
+                node = self.children_right[node]
+            path.append(node)
+        return path
@@ -1,9 +1,37 @@
 import manim as mn
 
-from blocks import InputBlock, OutputBlock, DecisionBlock, create_elbow_arrow
-
-
-class DecisionTree(mn.Scene):
+from blocks import (
+    InputBlock,
+    OutputBlock,
+    DecisionBlock,
+    create_elbow_arrow,
+    TreeSpec,
+    DecisionTreeDiagram,
+)
+from fast_hashing import FastHashMixin
+
+FRUIT_TREE = {
+    "question": "Is it soft?",
+    "feature": 0,
+    "threshold": 0.5,
+    "left": {
+        "question": "Is it sweet?",
+        "feature": 1,
+        "threshold": 0.5,
+        "left": {"label": "Unripe"},
+        "right": {"label": "Perfect"},
+    },
+    "right": {
+        "question": "Is it sour?",
+        "feature": 2,
+        "threshold": 0.5,
+        "left": {"label": "Perfect"},
+        "right": {"label": "Ripe"},
+    },
+}
+
+
+class DecisionTree(FastHashMixin, mn.Scene):
     def construct(self):
         self.camera.background_color = mn.BLUE_E
 
@@ -122,6 +150,42 @@ class DecisionTree(mn.Scene):
         self.wait(2)
 
 
+class FittedDecisionTree(FastHashMixin, mn.Scene):
+    """Decision tree built from a tree spec instead of hand-placed blocks.
+
+    Swap ``FRUIT_TREE`` for ``TreeSpec.from_sklearn(fitted_classifier)`` to draw a
+    real fitted tree; the tidy layout handles hundreds of nodes.
+    """
+
+    spec = TreeSpec.from_dict(FRUIT_TREE)
+    # softness, sweetness, sourness
+    sample = [0.2, 0.8, 0.1]
+
+    def construct(self):
+        self.camera.background_color = mn.BLUE_E
+
+        tree = DecisionTreeDiagram(self.spec, input_text="Fruit")
+        scale_factor = min(
+            self.camera.frame_width * 0.9 / tree.width,
+            self.camera.frame_height * 0.9 / tree.height,
+            1,
+        )
+        tree.scale(scale_factor)
+        tree.move_to(self.camera.frame_center)
+
+        self.play(mn.Write(tree.input_block))
+        self.play(
+            mn.Create(tree.arrow_batch),
+            *[mn.Write(node) for node in tree.nodes],
+        )
+        self.wait(1)
+
+        for step in tree.path_animations(self.sample):
+            self.play(*step)
+            self.wait(0.5)
+        self.wait(2)
+
+
 if __name__ == "__main__":
     scene = DecisionTree()
     scene.render()
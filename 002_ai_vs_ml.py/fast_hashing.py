@@ -0,0 +1,298 @@
+"""Fast play-call hashing for scenes with thousands of mobjects.
+
+Manim keys its partial movie cache on a JSON dump of the camera, the animations
+and every mobject on screen. For the dense scenes of this package that dump
+dominates the time of a re-render where nothing changed. ``FastHashMixin``
+replaces it with a digest of the raw point and colour buffers plus a handful of
+style scalars, so a cache hit costs milliseconds. Each mobject keeps the digest
+of its own buffers until one of them is rebound, resized or written in place,
+so only mobjects that changed since the last play are digested again.
+"""
+import functools
+import hashlib
+import inspect
+
+import numpy as np
+import manim as mn
+from manim.renderer import cairo_renderer
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Per-mobject arrays that hold everything the cairo camera draws
+_ARRAY_ATTRS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "rgbas")
+_SCALAR_ATTRS = (
+    "stroke_width",
+    "background_stroke_width",
+    "sheen_factor",
+    "z_index",
+    "joint_type",
+    "cap_style",
+    "shade_in_3d",
+)
+_CAMERA_ATTRS = (
+    "pixel_width",
+    "pixel_height",
+    "frame_width",
+    "frame_height",
+    "frame_rate",
+    "background_color",
+    "background_opacity",
+)
+# Animation attributes that are either derived during the play or hashed separately
+_SKIPPED_ANIMATION_ATTRS = {"mobject", "starting_mobject", "suspend_mobject_updating", "buffer"}
+# Instance attribute holding (buffers, scalars, generation, digest) of the last digest
+_MEMO_ATTR = "_fast_hash_memo"
+# Bumped to drop every memoized digest at once
+_generation = 0
+
+
+def _new_hasher():
+    if xxhash is not None:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=16)
+
+
+def _array_bytes(array: np.ndarray):
+    return memoryview(np.ascontiguousarray(array)).cast("B")
+
+
+def _same_buffer(old, new) -> bool:
+    if old is None or new is None:
+        return old is new
+    return old[0] is new[0] and old[1:] == new[1:]
+
+
+def member_digest(mob) -> bytes:
+    """Digest of the buffers and style scalars of ``mob`` alone, memoized on ``mob``.
+
+    The memo holds on to the digested arrays, so their ids are not reused while
+    it is alive. It is valid while every array is the same object at the same
+    address with the same shape, the scalars are equal and no writer hook
+    (``install_digest_invalidation``) dropped it.
+    """
+    arrays = [getattr(mob, attr, None) for attr in _ARRAY_ATTRS]
+    buffers = tuple(
+        (array, array.ctypes.data, array.shape) if isinstance(array, np.ndarray) else None
+        for array in arrays
+    )
+    scalars = repr(tuple(getattr(mob, attr, None) for attr in _SCALAR_ATTRS)).encode()
+    memo = mob.__dict__.get(_MEMO_ATTR)
+    if (
+        memo is not None
+        and memo[2] == _generation
+        and memo[1] == scalars
+        and len(memo[0]) == len(buffers)
+        and all(map(_same_buffer, memo[0], buffers))
+    ):
+        return memo[3]
+
+    hasher = _new_hasher()
+    hasher.update(type(mob).__qualname__.encode())
+    for attr, array in zip(_ARRAY_ATTRS, arrays):
+        if isinstance(array, np.ndarray):
+            hasher.update(f"{attr}{array.dtype}{array.shape}".encode())
+            hasher.update(_array_bytes(array))
+    hasher.update(scalars)
+    digest = hasher.digest()
+    mob.__dict__[_MEMO_ATTR] = (buffers, scalars, _generation, digest)
+    return digest
+
+
+def forget_digests(mobjects=None) -> None:
+    """Drop the memoized digests of ``mobjects`` and their families, or of every mobject."""
+    global _generation
+    if mobjects is None:
+        _generation += 1
+        return
+    for mob in mobjects:
+        for member in mob.get_family():
+            member.__dict__.pop(_MEMO_ATTR, None)
+
+
+def install_digest_invalidation():
+    """Drop memoized digests in manim's methods writing arrays in place. Idempotent.
+
+    Rebinding an array changes its identity and invalidates the memo by itself;
+    these methods keep the array and change its content.
+    """
+    if getattr(mn.VMobject.update_rgbas_array, "forgets_digests", False):
+        return
+
+    def wrap(cls, name, written):
+        method = getattr(cls, name)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            forget_digests(written(self))
+            return method(self, *args, **kwargs)
+
+        wrapper.forgets_digests = True
+        setattr(cls, name, wrapper)
+
+    def itself(mob):
+        return [mob]
+
+    wrap(mn.Mobject, "apply_points_function_about_point", lambda mob: mob.family_members_with_points())
+    wrap(mn.VMobject, "update_rgbas_array", itself)
+    wrap(mn.VMobject, "set_anchors_and_handles", itself)
+    wrap(mn.VMobject, "pointwise_become_partial", itself)
+    wrap(mn.PMobject, "set_color", lambda mob: mob.family_members_with_points())
+    wrap(mn.ValueTracker, "set_value", itself)
+    wrap(mn.ComplexValueTracker, "set_value", itself)
+
+
+class PlayHasher:
+    """Digest of one play call; mobjects reached twice are only hashed once."""
+
+    def __init__(self):
+        self._mobject_digests = {}
+        # Ids of the containers and animations being fed, to cut reference cycles
+        self._active = set()
+
+    def mobject_digest(self, mob) -> bytes:
+        digest = self._mobject_digests.get(id(mob))
+        if digest is None:
+            hasher = _new_hasher()
+            for member in mob.get_family():
+                hasher.update(self._member_digest(member))
+            digest = hasher.digest()
+            self._mobject_digests[id(mob)] = digest
+        return digest
+
+    def _member_digest(self, mob) -> bytes:
+        key = ("member", id(mob))
+        digest = self._mobject_digests.get(key)
+        if digest is None:
+            digest = member_digest(mob)
+            self._mobject_digests[key] = digest
+        return digest
+
+    def feed(self, hasher, value):
+        """Add ``value`` to ``hasher``, recursing into containers and animations at any depth."""
+        if value is None or isinstance(value, (bool, int, float, str, bytes)):
+            hasher.update(repr(value).encode())
+        elif isinstance(value, np.ndarray):
+            hasher.update(f"{value.dtype}{value.shape}".encode())
+            hasher.update(_array_bytes(value))
+        elif isinstance(value, mn.Mobject):
+            hasher.update(self.mobject_digest(value))
+        elif isinstance(value, mn.ManimColor):
+            hasher.update(value.to_hex(with_alpha=True).encode())
+        elif id(value) in self._active and isinstance(value, (mn.Animation, list, tuple, dict)):
+            hasher.update(b"<cycle>")
+        elif isinstance(value, mn.Animation):
+            hasher.update(self.animation_digest(value))
+        elif isinstance(value, (list, tuple)):
+            self._active.add(id(value))
+            hasher.update(f"{type(value).__name__}{len(value)}".encode())
+            for item in value:
+                self.feed(hasher, item)
+            self._active.discard(id(value))
+        elif isinstance(value, dict):
+            self._active.add(id(value))
+            for key in sorted(value, key=repr):
+                hasher.update(repr(key).encode())
+                self.feed(hasher, value[key])
+            self._active.discard(id(value))
+        elif inspect.isfunction(value) or inspect.ismethod(value):
+            code = getattr(value, "__code__", None) or value.__func__.__code__
+            hasher.update(value.__qualname__.encode())
+            hasher.update(code.co_code)
+            hasher.update(repr(code.co_consts).encode())
+        else:
+            hasher.update(type(value).__qualname__.encode())
+
+    def animation_digest(self, animation) -> bytes:
+        self._active.add(id(animation))
+        hasher = _new_hasher()
+        hasher.update(type(animation).__qualname__.encode())
+        hasher.update(self.mobject_digest(animation.mobject))
+        for name in sorted(vars(animation)):
+            if name in _SKIPPED_ANIMATION_ATTRS:
+                continue
+            hasher.update(name.encode())
+            self.feed(hasher, vars(animation)[name])
+        self._active.discard(id(animation))
+        return hasher.digest()
+
+    def camera_digest(self, camera, extra) -> bytes:
+        hasher = _new_hasher()
+        hasher.update(type(camera).__qualname__.encode())
+        for attr in _CAMERA_ATTRS:
+            self.feed(hasher, getattr(camera, attr, None))
+        self.feed(hasher, extra)
+        return hasher.digest()
+
+
+def fast_hash_from_play_call(scene, camera, animations, mobjects, *args, **kwargs) -> str:
+    """Cache key of a play call, from raw buffers instead of a JSON dump."""
+    hasher = PlayHasher()
+    animations_hash = _new_hasher()
+    for animation in animations:
+        animations_hash.update(hasher.animation_digest(animation))
+    mobjects_hash = _new_hasher()
+    for mob in mobjects:
+        mobjects_hash.update(hasher.mobject_digest(mob))
+    return "_".join(
+        digest.hex()[:16]
+        for digest in (
+            hasher.camera_digest(camera, (args, kwargs)),
+            animations_hash.digest(),
+            mobjects_hash.digest(),
+        )
+    )
+
+
+def install_fast_hashing():
+    """Route the renderer's hashing to the fast path for scenes using ``FastHashMixin``."""
+    default_hash = cairo_renderer.get_hash_from_play_call
+    if getattr(default_hash, "default_hash", None) is not None:
+        return
+
+    def get_hash_from_play_call(scene, *args, **kwargs):
+        if isinstance(scene, FastHashMixin):
+            return fast_hash_from_play_call(scene, *args, **kwargs)
+        return default_hash(scene, *args, **kwargs)
+
+    get_hash_from_play_call.default_hash = default_hash
+    cairo_renderer.get_hash_from_play_call = get_hash_from_play_call
+    install_digest_invalidation()
+
+
+class FastHashMixin:
+    """Hash play calls from raw array buffers. Must come before the Scene in the bases.
+
+    Digests of unchanged mobjects are reused from the previous play. Animations
+    and updaters may write into any array of their mobjects in place, so those
+    mobjects are digested afresh after every play.
+    """
+
+    def setup(self):
+        super().setup()
+        install_fast_hashing()
+
+    def play(self, *args, **kwargs):
+        try:
+            super().play(*args, **kwargs)
+        finally:
+            if self.updaters:
+                forget_digests()
+            else:
+                animated = [
+                    animation.mobject
+                    for animation in _flatten(self.animations or [])
+                    if animation.mobject is not None
+                ]
+                updated = [mob for mob in self.get_mobject_family_members() if mob.updaters]
+                forget_digests(animated + updated)
+
+
+def _flatten(animations) -> list:
+    flat = []
+    for animation in animations:
+        flat.append(animation)
+        flat.extend(_flatten(getattr(animation, "animations", [])))
+    return flat
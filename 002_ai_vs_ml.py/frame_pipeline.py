@@ -0,0 +1,215 @@
+"""Rasterize frames straight into a ring of buffers drained by a background encoder thread.
+
+Mix ``FramePipelineMixin`` into a scene, or run a scene through it::
+
+    python frame_pipeline.py neural_network_sceene NeuronNetworkScene --slots 8
+
+The camera draws every frame directly into a free slot of a preallocated ring,
+with no ``get_frame`` copy. A writer thread hands filled slots to manim's file
+writer and returns them to the ring. When all slots are full, rendering blocks
+until the writer frees one. Per-scene throughput and queue occupancy are logged
+at the end of the render and kept in ``scene.frame_pipeline.metrics()``.
+"""
+import argparse
+import importlib
+import logging
+import queue
+import threading
+import time
+
+import numpy as np
+import manim as mn
+
+logger = logging.getLogger(__name__)
+
+
+class FramePipeline:
+    """Bounded ring of frame buffers and the thread writing them out in order."""
+
+    def __init__(self, write_frame, shape, n_slots: int = 8, dtype=np.uint8):
+        self.write_frame = write_frame
+        self.buffers = [np.zeros(shape, dtype=dtype) for _ in range(n_slots)]
+        self._free = queue.Queue()
+        for slot in range(n_slots):
+            self._free.put(slot)
+        self._filled = queue.Queue(maxsize=n_slots)
+        self._error = None
+
+        self.frames = 0
+        self.producer_wait = 0.0
+        self.encode_time = 0.0
+        self.occupancy = []
+        self.started = time.perf_counter()
+
+        self._thread = threading.Thread(target=self._run, name="frame-writer", daemon=True)
+        self._thread.start()
+
+    def acquire(self) -> int:
+        """Index of a free slot; blocks while the writer is behind."""
+        self._raise_writer_error()
+        started = time.perf_counter()
+        slot = self._free.get()
+        self.producer_wait += time.perf_counter() - started
+        return slot
+
+    def release(self, slot: int):
+        """Return an unused slot to the ring."""
+        self._free.put(slot)
+
+    def submit(self, slot: int, num_frames: int = 1):
+        """Queue a filled slot to be written ``num_frames`` times."""
+        self.occupancy.append(self._filled.qsize())
+        self._filled.put((slot, num_frames))
+        self.frames += num_frames
+
+    def drain(self):
+        """Wait until every queued frame has been written."""
+        self._filled.join()
+        self._raise_writer_error()
+
+    def close(self):
+        self._filled.put(None)
+        self._thread.join()
+        self._raise_writer_error()
+
+    def metrics(self) -> dict:
+        wall_time = time.perf_counter() - self.started
+        return {
+            "frames": self.frames,
+            "wall_time": wall_time,
+            "frames_per_second": self.frames / wall_time if wall_time else 0.0,
+            # Large when encoding is the bottleneck
+            "producer_wait": self.producer_wait,
+            "encode_time": self.encode_time,
+            # Close to the slot count when encoding is the bottleneck, near 0 when rasterizing is
+            "mean_occupancy": float(np.mean(self.occupancy)) if self.occupancy else 0.0,
+            "max_occupancy": max(self.occupancy, default=0),
+            "slots": len(self.buffers),
+        }
+
+    def _run(self):
+        while True:
+            item = self._filled.get()
+            if item is None:
+                self._filled.task_done()
+                return
+            slot, num_frames = item
+            try:
+                if self._error is None:
+                    started = time.perf_counter()
+                    for _ in range(num_frames):
+                        self.write_frame(self.buffers[slot])
+                    self.encode_time += time.perf_counter() - started
+            except Exception as error:
+                self._error = error
+            finally:
+                self._free.put(slot)
+                self._filled.task_done()
+
+    def _raise_writer_error(self):
+        if self._error is not None:
+            raise RuntimeError("Frame writer thread failed") from self._error
+
+
+class FramePipelineMixin:
+    """Render frames into a ``FramePipeline``. Must come before the Scene in the bases."""
+
+    pipeline_slots = 8
+
+    def setup(self):
+        super().setup()
+        renderer = self.renderer
+        camera = self.camera
+        file_writer = renderer.file_writer
+        pipeline = FramePipeline(
+            file_writer.write_frame, camera.pixel_array.shape, self.pipeline_slots
+        )
+        self.frame_pipeline = pipeline
+        # Drawing outside of frames (static backgrounds, still images) goes here
+        scratch = camera.pixel_array
+        current = {"slot": None}
+
+        def pipelined_render(scene, time, moving_mobjects=None):
+            if renderer.skip_animations:
+                return
+            slot = pipeline.acquire()
+            current["slot"] = slot
+            camera.pixel_array = pipeline.buffers[slot]
+            try:
+                renderer.update_frame(scene, moving_mobjects)
+                renderer.add_frame(camera.pixel_array)
+            finally:
+                camera.pixel_array = scratch
+
+        def pipelined_add_frame(frame, num_frames=1):
+            if renderer.skip_animations:
+                return
+            renderer.time += num_frames / camera.frame_rate
+            slot = current["slot"]
+            current["slot"] = None
+            if slot is None or frame is not pipeline.buffers[slot]:
+                # Frozen frames come as copies from get_frame
+                if slot is not None:
+                    pipeline.release(slot)
+                slot = pipeline.acquire()
+                pipeline.buffers[slot][...] = frame
+            pipeline.submit(slot, num_frames)
+
+        renderer.render = pipelined_render
+        renderer.add_frame = pipelined_add_frame
+
+        # Partial movie streams open and close between plays; no frame may be in flight then
+        for name in ("begin_animation", "end_animation"):
+            method = getattr(file_writer, name)
+
+            def drained(*args, _method=method, **kwargs):
+                pipeline.drain()
+                return _method(*args, **kwargs)
+
+            setattr(file_writer, name, drained)
+
+        scene_finished = renderer.scene_finished
+
+        def pipelined_scene_finished(scene):
+            pipeline.close()
+            metrics = pipeline.metrics()
+            logger.info(
+                "%s: %d frames at %.1f fps, producer waited %.2fs, encoder busy %.2fs, "
+                "queue occupancy %.1f/%d",
+                type(self).__name__,
+                metrics["frames"],
+                metrics["frames_per_second"],
+                metrics["producer_wait"],
+                metrics["encode_time"],
+                metrics["mean_occupancy"],
+                metrics["slots"],
+            )
+            return scene_finished(scene)
+
+        renderer.scene_finished = pipelined_scene_finished
+
+
+def pipelined(scene_class, slots: int = FramePipelineMixin.pipeline_slots):
+    """Subclass of ``scene_class`` with ``FramePipelineMixin`` applied."""
+    return type(scene_class.__name__, (FramePipelineMixin, scene_class), {"pipeline_slots": slots})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module")
+    parser.add_argument("scene")
+    parser.add_argument("--quality", default="high_quality")
+    parser.add_argument("--slots", type=int, default=FramePipelineMixin.pipeline_slots)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    mn.config.quality = args.quality
+    scene_class = getattr(importlib.import_module(args.module), args.scene)
+    scene = pipelined(scene_class, args.slots)()
+    scene.render()
+    for name, value in scene.frame_pipeline.metrics().items():
+        print(f"{name:>18}: {value}")
+
+
+if __name__ == "__main__":
+    main()
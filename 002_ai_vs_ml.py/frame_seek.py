@@ -0,0 +1,125 @@
+"""Render single frames of a scene at given times, without rasterizing anything else.
+
+Usage:
+    python frame_seek.py random_forest_scene RandomForestScene 12.5 end --quality high_quality
+
+``construct`` runs with every play call skipped, so animations jump straight to
+their end states. Only the plays containing a requested time are stepped to
+that time, and only those frames are rasterized and written as PNG files to
+``--output-dir``. ``end`` stands for the last frame of the scene.
+"""
+import argparse
+import importlib
+import math
+import sys
+from pathlib import Path
+
+import manim as mn
+import numpy as np
+
+
+def parse_time(value: str) -> float:
+    return math.inf if value == "end" else float(value)
+
+
+class FrameSeekMixin:
+    """Write the frames at ``seek_times`` to ``seek_dir``. Must come before the Scene in the bases.
+
+    Meant to run with every play skipped (``from_animation_number`` past the
+    last play), which is how ``seek_frames`` renders.
+    """
+
+    seek_times = ()
+    seek_dir = "frames"
+
+    def __init__(self, *args, **kwargs):
+        self._seek_clock = 0.0
+        self._pending_times = sorted(self.seek_times)
+        self.seek_files = []
+        super().__init__(*args, **kwargs)
+
+    def setup(self):
+        super().setup()
+
+        # Plays are never rasterized here, so there is no background to prepare
+        def skip_static_frame_data(scene, static_mobjects):
+            self.renderer.static_image = None
+            return None
+
+        self.renderer.save_static_frame_data = skip_static_frame_data
+
+    def is_current_animation_frozen_frame(self) -> bool:
+        # A frozen wait would rasterize its frame even while skipping
+        return False
+
+    def play_internal(self, skip_rendering: bool = False):
+        duration = self.get_run_time(self.animations)
+        frame_rate = self.camera.frame_rate
+        # The time grid of Scene.play_internal, ceil(duration * frame_rate) frames
+        times = np.arange(0, duration, 1 / frame_rate)
+        if super().is_current_animation_frozen_frame():
+            # The movie freezes static waits for int(duration * frame_rate) frames
+            times = times[: int(duration * frame_rate)]
+        end = self._seek_clock + len(times) / frame_rate
+        while self._pending_times and self._pending_times[0] < end:
+            t = self._pending_times.pop(0)
+            # The frame the movie shows at t
+            index = math.floor((t - self._seek_clock) * frame_rate)
+            self.update_to_time(times[min(max(index, 0), len(times) - 1)])
+            self.capture_frame(t)
+        super().play_internal(skip_rendering=True)
+        self._seek_clock = end
+
+    def tear_down(self):
+        super().tear_down()
+        # Times past the last play show the final state
+        while self._pending_times:
+            self.capture_frame(self._pending_times.pop(0))
+
+    def capture_frame(self, t: float):
+        self.renderer.update_frame(self)
+        directory = Path(self.seek_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        label = "end" if math.isinf(t) else f"{t:08.3f}s"
+        path = directory / f"{type(self).__name__}_{label}.png"
+        self.camera.get_image().save(path)
+        self.seek_files.append(path)
+
+
+def seek_frames(module_name, class_name, times, quality="high_quality", output_dir="frames") -> list:
+    """Render the frames of a scene at ``times`` and return the PNG paths."""
+    scene_class = getattr(importlib.import_module(module_name), class_name)
+    seek_class = type(
+        class_name,
+        (FrameSeekMixin, scene_class),
+        {"seek_times": tuple(times), "seek_dir": output_dir},
+    )
+    with mn.tempconfig(
+        {
+            "quality": quality,
+            "from_animation_number": sys.maxsize,
+            "write_to_movie": False,
+            "save_last_frame": False,
+            "progress_bar": "none",
+        }
+    ):
+        scene = seek_class()
+        scene.render()
+    return scene.seek_files
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module")
+    parser.add_argument("scene")
+    parser.add_argument("times", nargs="+", type=parse_time, help="Seconds, or 'end'.")
+    parser.add_argument("--quality", default="high_quality")
+    parser.add_argument("--output-dir", default="frames")
+    args = parser.parse_args(argv)
+
+    for path in seek_frames(args.module, args.scene, args.times, args.quality, args.output_dir):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
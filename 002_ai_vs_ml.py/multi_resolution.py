@@ -0,0 +1,174 @@
+"""Render one scene at several resolutions from a single evaluation of its timeline.
+
+Usage:
+    python multi_resolution.py decision_tree_scene DecisionTree --resolutions 854x480 1920x1080 3840x2160
+
+The largest resolution renders through manim as usual. Every frame of it is
+also rasterized, from the same mobject state, by one extra camera per smaller
+resolution. The extra cameras run in a thread pool next to the main camera and
+feed their own encoders, writing ``<output-dir>/<Scene>_<height>p.mp4``.
+``construct``, interpolation and text shaping therefore run once.
+"""
+import argparse
+import importlib
+from concurrent.futures import ThreadPoolExecutor, wait
+from fractions import Fraction
+from pathlib import Path
+
+import manim as mn
+
+
+def parse_resolution(value: str) -> tuple:
+    width, _, height = value.partition("x")
+    return int(width), int(height)
+
+
+class ResolutionTarget:
+    """A camera of its own size and the encoder its frames go to."""
+
+    def __init__(self, width: int, height: int, frame_rate: float, path: Path):
+        import av
+
+        self.camera = mn.Camera(pixel_width=width, pixel_height=height, frame_rate=frame_rate)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.container = av.open(str(path), mode="w")
+        self.stream = self.container.add_stream(
+            "libx264", rate=Fraction(frame_rate).limit_denominator(1001)
+        )
+        self.stream.width = width
+        self.stream.height = height
+        self.stream.pix_fmt = "yuv420p"
+        self.frames_written = 0
+
+    def capture(self, scene):
+        """Rasterize the current state of ``scene`` on this target's camera."""
+        camera = self.camera
+        if camera.background_color != scene.camera.background_color:
+            camera.background_color = scene.camera.background_color
+        if camera.background_opacity != scene.camera.background_opacity:
+            camera.background_opacity = scene.camera.background_opacity
+        mobjects = list(scene.mobjects)
+        mobjects += [mob for mob in scene.foreground_mobjects if mob not in mobjects]
+        camera.reset()
+        camera.capture_mobjects(mobjects)
+
+    def encode(self, num_frames: int = 1):
+        import av
+
+        frame = av.VideoFrame.from_ndarray(self.camera.pixel_array, format="rgba")
+        for _ in range(num_frames):
+            frame.pts = self.frames_written
+            self.frames_written += 1
+            for packet in self.stream.encode(frame):
+                self.container.mux(packet)
+
+    def close(self):
+        for packet in self.stream.encode():
+            self.container.mux(packet)
+        self.container.close()
+
+
+class MultiResolutionMixin:
+    """Also render the scene at ``extra_resolutions``. Must come before the Scene in the bases.
+
+    Frames served from manim's partial movie cache are never rasterized, so
+    caching should be disabled, as ``render_resolutions`` does.
+    """
+
+    extra_resolutions = ()
+    output_dir = "media/multi_resolution"
+
+    def setup(self):
+        super().setup()
+        renderer = self.renderer
+        self.resolution_targets = [
+            ResolutionTarget(
+                width,
+                height,
+                self.camera.frame_rate,
+                Path(self.output_dir) / f"{type(self).__name__}_{height}p.mp4",
+            )
+            for width, height in self.extra_resolutions
+        ]
+        pool = ThreadPoolExecutor(max_workers=max(1, len(self.resolution_targets)))
+        self._resolution_pool = pool
+        self._pending_captures = None
+        render = renderer.render
+        add_frame = renderer.add_frame
+
+        def multi_render(scene, time, moving_mobjects=None):
+            if not renderer.skip_animations:
+                # The extra cameras draw while the main one does
+                self._pending_captures = [
+                    pool.submit(target.capture, scene) for target in self.resolution_targets
+                ]
+            return render(scene, time, moving_mobjects)
+
+        def multi_add_frame(frame, num_frames=1):
+            if not renderer.skip_animations:
+                captures = self._pending_captures or [
+                    pool.submit(target.capture, self) for target in self.resolution_targets
+                ]
+                self._pending_captures = None
+                wait(captures)
+                for future in [
+                    pool.submit(target.encode, num_frames) for target in self.resolution_targets
+                ] + captures:
+                    future.result()
+            return add_frame(frame, num_frames)
+
+        renderer.render = multi_render
+        renderer.add_frame = multi_add_frame
+
+    def tear_down(self):
+        super().tear_down()
+        self._resolution_pool.shutdown()
+        for target in self.resolution_targets:
+            target.close()
+
+
+def render_resolutions(module_name, class_name, resolutions, frame_rate=None, output_dir=None) -> list:
+    """Render a scene once for all ``resolutions``; returns the movie paths, largest first."""
+    resolutions = sorted(resolutions, key=lambda size: -size[0] * size[1])
+    (width, height), extra_resolutions = resolutions[0], resolutions[1:]
+    scene_class = getattr(importlib.import_module(module_name), class_name)
+    attrs = {"extra_resolutions": tuple(extra_resolutions)}
+    if output_dir is not None:
+        attrs["output_dir"] = output_dir
+    multi_class = type(class_name, (MultiResolutionMixin, scene_class), attrs)
+
+    options = {"pixel_width": width, "pixel_height": height, "disable_caching": True}
+    if frame_rate is not None:
+        options["frame_rate"] = frame_rate
+    with mn.tempconfig(options):
+        scene = multi_class()
+        scene.render()
+    return [scene.renderer.file_writer.movie_file_path] + [
+        target.path for target in scene.resolution_targets
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module")
+    parser.add_argument("scene")
+    parser.add_argument(
+        "--resolutions",
+        nargs="+",
+        type=parse_resolution,
+        default=[(854, 480), (1920, 1080), (3840, 2160)],
+        metavar="WIDTHxHEIGHT",
+    )
+    parser.add_argument("--frame-rate", type=float, default=None)
+    parser.add_argument("--output-dir", default=None)
+    args = parser.parse_args(argv)
+
+    for path in render_resolutions(
+        args.module, args.scene, args.resolutions, args.frame_rate, args.output_dir
+    ):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
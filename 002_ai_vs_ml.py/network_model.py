@@ -0,0 +1,81 @@
+"""Small NumPy multilayer perceptron whose activations drive the network scenes."""
+from itertools import islice
+
+import numpy as np
+
+
+def sigmoid(values: np.ndarray) -> np.ndarray:
+    """Logistic function, computed in place."""
+    np.negative(values, out=values)
+    np.exp(values, out=values)
+    values += 1
+    return np.reciprocal(values, out=values)
+
+
+class NetworkModel:
+    """Dense layers with sigmoid activations and random weights.
+
+    Activations of all layers are computed together for a whole batch, as a
+    list of ``(batch, width)`` arrays with the inputs first.
+    """
+
+    def __init__(self, layer_widths, seed: int = 0):
+        self.layer_widths = tuple(layer_widths)
+        self.rng = np.random.default_rng(seed)
+        self.weights = [
+            self.rng.normal(0, 2 / np.sqrt(n_in), size=(n_in, n_out))
+            for n_in, n_out in zip(self.layer_widths[:-1], self.layer_widths[1:])
+        ]
+        self.biases = [self.rng.normal(0, 0.5, size=n_out) for n_out in self.layer_widths[1:]]
+
+    def random_inputs(self, n_samples: int) -> np.ndarray:
+        return self.rng.uniform(0, 1, size=(n_samples, self.layer_widths[0]))
+
+    def forward(self, inputs) -> list:
+        """Activations of every layer for a batch of inputs."""
+        inputs = np.atleast_2d(np.asarray(inputs, dtype=float))
+        activations = [inputs] + [np.empty((len(inputs), width)) for width in self.layer_widths[1:]]
+        self._forward_into(activations, len(inputs))
+        return activations
+
+    def stream(self, samples, batch_size: int = 64):
+        """Yield the per-layer activation vectors of every sample, in constant memory.
+
+        ``samples`` may be any iterable of input vectors, e.g. a generator. The
+        yielded vectors are views into buffers reused for the next batch, so copy
+        them to keep them.
+        """
+        buffers = [np.empty((batch_size, width)) for width in self.layer_widths]
+        samples = iter(samples)
+        while True:
+            n = 0
+            for n, sample in enumerate(islice(samples, batch_size), start=1):
+                buffers[0][n - 1] = sample
+            if n == 0:
+                return
+            self._forward_into(buffers, n)
+            for row in range(n):
+                yield tuple(buffer[row] for buffer in buffers)
+
+    def edge_contributions(self, layer: int, activations) -> np.ndarray:
+        """``|a_i * w_ij|`` for the edges from ``layer`` into the next one, source-major.
+
+        The order matches ``ConnectionMesh.between(sources, targets)``.
+        """
+        return np.abs(np.asarray(activations)[:, None] * self.weights[layer]).reshape(-1)
+
+    @staticmethod
+    def most_active(activations, k: int) -> np.ndarray:
+        """Indices of the ``k`` largest activations, strongest first."""
+        activations = np.asarray(activations)
+        k = min(k, len(activations))
+        top = np.argpartition(-activations, k - 1)[:k]
+        return top[np.argsort(-activations[top])]
+
+    def _forward_into(self, activations: list, n: int):
+        for weights, bias, previous, current in zip(
+            self.weights, self.biases, activations[:-1], activations[1:]
+        ):
+            np.matmul(previous[:n], weights, out=current[:n])
+            current[:n] += bias
+            sigmoid(current[:n])
@@ -1,44 +1,83 @@
 from typing import Union
 import logging
-import random
 import manim as mn
-from blocks import InputBlock, OutputBlock
-
-random.seed(0)
+import numpy as np
+from blocks import InputBlock, OutputBlock, ConnectionMesh, SignalFlow, NeuronArray, LayerActivation, ActivationStream, CachedBoundsMixin, cached_text
+from network_model import NetworkModel
+from static_layers import StaticLayerMixin
+from fast_hashing import FastHashMixin
 
 logger = logging.getLogger(__name__)
 
-class NeuronLayer(mn.VGroup):
+class NeuronLayer(CachedBoundsMixin, mn.VGroup):
 
     def __init__(
-        self, neuron_number: int, layer_color: Union[mn.color, list[mn.color]], **kwargs,
+        self,
+        neuron_number: int,
+        layer_color: Union[mn.color, list[mn.color]],
+        compact: bool = False,
+        **kwargs,
     ):
+        """
+        Args:
+            neuron_number (int): Number of neurons in the layer.
+            layer_color: A color for all neurons, or a list of colors cycled over the neurons.
+            compact (bool): Keep the neurons in a single NumPy-backed NeuronArray instead of
+                one Dot each. ``neurons`` then holds lightweight views with the same API.
+        """
         super().__init__(**kwargs)
         self.layer_number = neuron_number
         self.layer_color = layer_color
+        self.compact = compact
 
         if isinstance(layer_color, list):
             colors = [layer_color[i % len(layer_color)] for i in range(neuron_number)]
+        elif compact:
+            colors = layer_color  # NeuronArray broadcasts a single color
         else:
             colors = [layer_color] * neuron_number
 
+        if compact:
+            self.neuron_array = NeuronArray.in_row(neuron_number, colors, radius=1, buff=1)
+            self.neurons = self.neuron_array.views()
+            self.activations = self.neuron_array.activations
+            self.add(self.neuron_array)
+            return
+
         self.neurons = mn.VGroup(
             *[mn.Dot(color=color, radius=1) for color in colors]
         )
         self.neurons.arrange(mn.RIGHT, buff=1)
+        self.activations = np.zeros(neuron_number)
 
         self.add(self.neurons)
 
+    def get_centers(self) -> np.ndarray:
+        if self.compact:
+            return self.neuron_array.get_centers()
+        return np.array([neuron.get_center() for neuron in self.neurons])
+
+
+class NeuronNetworkScene(FastHashMixin, StaticLayerMixin, mn.Scene):
+    # Widths of the three hidden layers; subclasses can scale the network up
+    layer_widths = (10, 8, 8)
+    compact_layers = False
+    output_labels = ("Rotten", "Unripe", "Perfect")
+    output_colors = [mn.RED, mn.ORANGE, mn.GREEN]
 
-class NeuronNetworkScene(mn.Scene):
     def construct(self):
         self.camera.background_color = mn.BLUE_E
+        self.model = NetworkModel((*self.layer_widths, len(self.output_labels)), seed=0)
+        self.value_labels = mn.VGroup()
+
         input_block = InputBlock("Input")
-        layer_1 = NeuronLayer(10, mn.WHITE)
-        layer_2 = NeuronLayer(8, mn.WHITE)
-        layer_3 = NeuronLayer(8, mn.WHITE)
-        final_layer = NeuronLayer(3, layer_color=[mn.RED, mn.ORANGE, mn.GREEN])
+        layer_1, layer_2, layer_3 = [
+            NeuronLayer(width, mn.WHITE, compact=self.compact_layers)
+            for width in self.layer_widths
+        ]
+        final_layer = NeuronLayer(len(self.output_labels), layer_color=self.output_colors)
         output_block = OutputBlock("Output")
+        self.layers = [layer_1, layer_2, layer_3, final_layer]
 
         neural_network = mn.VGroup(
             input_block,
@@ -59,21 +98,29 @@ class NeuronNetworkScene(mn.Scene):
         layer_2.next_to(layer_1, mn.DOWN, buff=2 * scale_factor)
         layer_3.next_to(layer_2, mn.DOWN, buff=2 * scale_factor)
 
-        # Randomly select active neurons in the second layer
-        num_active = min(5, len(layer_2.neurons))  # Select up to 5 active neurons
-        active_neurons = random.sample(list(layer_2.neurons), num_active)
-
-        # Randomly select active neurons in the third layer
-        num_active_3 = min(5, len(layer_3.neurons))
-        active_neurons_3 = random.sample(list(layer_3.neurons), num_active_3)
+        # One sample through the model gives the activations of every layer
+        layer_inputs = np.round(self.model.random_inputs(1), 2)
+        activations = [values[0] for values in self.model.forward(layer_inputs)]
 
-        # final layer
-        active_neurons_final = final_layer.neurons[-1]
+        # Up to 5 most active neurons in the second and third layer, the winner in the last
+        active_neurons = [layer_2.neurons[i] for i in NetworkModel.most_active(activations[1], 5)]
+        active_neurons_3 = [layer_3.neurons[i] for i in NetworkModel.most_active(activations[2], 5)]
+        winner = int(np.argmax(activations[3]))
+        active_neurons_final = [final_layer.neurons[winner]]
 
-        connections_1_2, dots_1_2 = create_layer_connections(layer_1, layer_2, active_neurons=active_neurons)
-        connections_2_3, dots_2_3 = create_layer_connections(layer_2, layer_3)
-        connections_3_4, dots_3_4 = create_layer_connections(layer_3, final_layer)
+        connections_1_2 = create_layer_connections(layer_1, layer_2, active_neurons=active_neurons)
+        connections_2_3 = create_layer_connections(layer_2, layer_3)
+        connections_3_4 = create_layer_connections(layer_3, final_layer)
         all_connections = mn.VGroup(connections_1_2, connections_2_3, connections_3_4)
+        # The input block and the connection web only change when animated themselves
+        self.mark_static(input_block, *all_connections)
+
+        # Edge weights times source activations, in the source-major order of the meshes
+        contributions_1_2 = self.model.edge_contributions(0, activations[0]).reshape(
+            len(layer_1.neurons), -1
+        )[:, NetworkModel.most_active(activations[1], 5)].reshape(-1)
+        contributions_2_3 = self.model.edge_contributions(1, activations[1])
+        contributions_3_4 = self.model.edge_contributions(2, activations[2])
 
         self.play(mn.Write(input_block))
         self.wait(.5)
@@ -88,101 +135,91 @@ class NeuronNetworkScene(mn.Scene):
         self.wait(.5)
         self.play(mn.Write(output_block))
 
-        layer_inputs = [
-            round(random.uniform(0, 1), 2) for _ in range(layer_1.layer_number)
-        ]
-
         # first to second layer
-        self.draw_layer_values(layer_1, inputs=layer_inputs)
-        self.animate_signal_flow(connections_1_2, dots_1_2)
+        self.draw_layer_values(layer_1, activations[0])
+        self.animate_signal_flow(connections_1_2, contributions_1_2)
         self.highlight_active_neurons(active_neurons)
-        self.draw_layer_values(layer_2, active_neurons=active_neurons)
+        self.draw_layer_values(layer_2, activations[1])
 
         # second to third layer
-        self.animate_signal_flow(connections_2_3, dots_2_3)
+        self.animate_signal_flow(connections_2_3, contributions_2_3)
         self.highlight_active_neurons(active_neurons_3)
-        self.draw_layer_values(layer_3, active_neurons=active_neurons_3)
+        self.draw_layer_values(layer_3, activations[2])
 
         # third to final layer
-        self.animate_signal_flow(connections_3_4, dots_3_4)
+        self.animate_signal_flow(connections_3_4, contributions_3_4)
         self.highlight_active_neurons(active_neurons_final)
-        self.draw_layer_values(final_layer, active_neurons=active_neurons_final)
+        self.draw_layer_values(final_layer, activations[3])
 
-        last_neuron = final_layer.neurons[-1]
-        new_text = mn.Text("Perfect", color=mn.BLACK, font_size=18)
+        winning_neuron = final_layer.neurons[winner]
+        new_text = cached_text(self.output_labels[winner], color=mn.BLACK, font_size=18)
         new_text.move_to(output_block[1].get_center())
 
         self.play(
-            last_neuron.animate.scale(1.5),
-            output_block[0].animate.set_fill(mn.GREEN, opacity=0.8),
+            winning_neuron.animate.scale(1.5),
+            output_block[0].animate.set_fill(self.output_colors[winner], opacity=0.8),
             mn.Transform(output_block[1], new_text),
             run_time=1,
         )
         self.wait(2)
 
-    def draw_layer_values(self, layer, inputs=None, active_neurons=None):
+    def draw_layer_values(self, layer, activations):
         input_labels = mn.VGroup()
-        neuron_animations = []
-
-        for i, neuron in enumerate(layer.neurons):
-            if inputs is not None:
-                input_value = inputs[i]
-            elif active_neurons is not None:
-                input_value = (
-                    round(random.uniform(0.5, 1), 2) if neuron in active_neurons else 0.09
-                )
-            else:
-                raise ValueError("Either inputs or active_neurons must be provided")
-
-            label = mn.Text(str(input_value), font_size=18, color=mn.BLACK)
+        for neuron, value in zip(layer.neurons, activations):
+            label = cached_text(f"{value:.2f}", font_size=18, color=mn.BLACK)
             label.move_to(neuron.get_center(), aligned_edge=mn.ORIGIN)
             input_labels.add(label)
-
-            neuron_animations.append(neuron.animate.set_opacity(input_value))
-            neuron_animations.append(neuron.animate.set_fill(opacity=input_value))
+        self.value_labels.add(input_labels)
 
         self.play(mn.Write(input_labels))
         self.wait(0.25)
-        self.play(*neuron_animations, run_time=.5)
+        self.play(LayerActivation(layer, activations), run_time=.5)
         self.wait(0.25)
 
-    def animate_signal_flow(self, connections, dots):
-        animations = []
-        for connection, dot in zip(connections, dots):
-            animations.append(
-                mn.MoveAlongPath(dot, path=connection, rate_func=mn.linear)
-            )
-        self.play(*animations, run_time=1)
+    def animate_signal_flow(self, connections, contributions, n_strongest=10):
+        connections.highlight_edges(NetworkModel.most_active(contributions, n_strongest))
+        self.play(SignalFlow.along(connections), run_time=1)
 
     def highlight_active_neurons(self, active_neurons):
         highlight_animations = [neuron.animate.set_color(mn.GREEN) for neuron in active_neurons]
         self.play(*highlight_animations)
 
 
+class StreamingNetworkScene(NeuronNetworkScene):
+    """The network scene followed by a stream of samples through the same model."""
+
+    n_samples = 300
+
+    def construct(self):
+        super().construct()
+        self.play(mn.FadeOut(self.value_labels))
+
+        inputs = (self.model.random_inputs(1)[0] for _ in range(self.n_samples))
+        self.play(
+            *ActivationStream.for_layers(self.layers, self.model.stream(inputs), self.n_samples)
+        )
+        self.wait(1)
+
+
 def create_layer_connections(layer1, layer2, active_neurons = None):
-    connections = mn.VGroup()
-    dots = mn.VGroup()
+    # Edges into active neurons are the point of the picture, never thin them out
     if active_neurons:
-        target_neurons = active_neurons
+        target_centers = np.array([neuron.get_center() for neuron in active_neurons])
+        lod = "full"
     else:
-        target_neurons = layer2.neurons
-
-    for neuron1 in layer1.neurons:
-        for neuron2 in target_neurons:
-            line = mn.Line(
-                neuron1.get_center(),
-                neuron2.get_center(),
-                stroke_width=0.5,
-                color=mn.LIGHT_GRAY,
-            )
-            line.set_opacity(0.75)
-            connections.add(line)
-
-            dot = mn.Dot(color=mn.GREEN, radius=0.05)
-            dot.move_to(neuron1.get_center())
-            dots.add(dot)
-
-    return connections, dots
+        target_centers = layer2.get_centers()
+        lod = "auto"
+
+    connections = ConnectionMesh.between(
+        layer1.get_centers(),
+        target_centers,
+        stroke_width=0.5,
+        color=mn.LIGHT_GRAY,
+        opacity=0.75,
+        lod=lod,
+    )
+
+    return connections
 
 
 def get_scale(camera, group):
@@ -0,0 +1,195 @@
+"""Opt-in per-play profiling for the scenes of this package.
+
+Usage:
+    python profiling.py neural_network_sceene NeuronNetworkScene --quality low_quality
+
+or mix it into a scene yourself::
+
+    class ProfiledForest(ProfiledSceneMixin, RandomForestScene):
+        pass
+
+Every play/wait call is recorded with its wall time, rasterized frames, mobject
+family size, number of Animation objects and peak RSS. Reports are written to
+``profiles/<Scene>.json`` and ``profiles/<Scene>.txt`` when the scene ends.
+"""
+import argparse
+import importlib
+import json
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import manim as mn
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Frames of these functions are plumbing, not part of a play call's "stack"
+_SKIPPED_FRAMES = {"play", "wait", "pause", "wait_until"}
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def count_animations(animations) -> int:
+    """Number of Animation objects, counting the members of groups and successions."""
+    total = 0
+    for animation in animations:
+        total += 1
+        total += count_animations(getattr(animation, "animations", []))
+    return total
+
+
+def call_stack(frame) -> list:
+    """Function names from ``construct`` down to the caller of ``play``."""
+    names = []
+    while frame is not None:
+        name = frame.f_code.co_name
+        if frame.f_globals.get("__name__") != __name__ and name not in _SKIPPED_FRAMES:
+            names.append(name)
+        if name == "construct":
+            break
+        frame = frame.f_back
+    return names[::-1]
+
+
+class PlayProfiler:
+    """Collects one record per play call and notifies subscribers as they arrive."""
+
+    def __init__(self):
+        self.records = []
+        self._subscribers = []
+
+    def subscribe(self, callback):
+        """Call ``callback(record)`` after every play; returns the callback."""
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        self._subscribers.remove(callback)
+
+    def add(self, record: dict):
+        self.records.append(record)
+        for callback in self._subscribers:
+            callback(record)
+
+    def folded_stacks(self) -> dict:
+        """Wall time per ``construct;caller;...;kind`` path, flamegraph folded format."""
+        totals = defaultdict(float)
+        for record in self.records:
+            totals[";".join(record["stack"] + [record["kind"]])] += record["wall_time"]
+        return dict(totals)
+
+    def summary(self, width: int = 40) -> str:
+        """Text report of the folded stacks, most expensive first."""
+        folded = self.folded_stacks()
+        stacks = sorted(folded.items(), key=lambda item: -item[1])
+        total = sum(folded.values()) or 1.0
+        lines = [f"{'wall':>8}  {'share':>6}  stack"]
+        for stack, wall_time in stacks:
+            bar = "#" * max(1, round(width * wall_time / total))
+            lines.append(f"{wall_time:7.2f}s  {wall_time / total:6.1%}  {stack}  {bar}")
+
+        lines.append("")
+        lines.append("Slowest play calls:")
+        for record in sorted(self.records, key=lambda record: -record["wall_time"])[:10]:
+            lines.append(
+                f"{record['wall_time']:7.2f}s  #{record['index']:<4} {record['kind']:4} "
+                f"frames={record['frames']:<5} animations={record['animations']:<6} "
+                f"family={record['family_size']:<7} {';'.join(record['stack'])}"
+            )
+        return "\n".join(lines)
+
+    def to_json(self) -> dict:
+        return {"records": self.records, "folded_stacks": self.folded_stacks()}
+
+    def write(self, directory, name: str):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / f"{name}.json", "w") as file:
+            json.dump(self.to_json(), file, indent=2)
+        with open(directory / f"{name}.txt", "w") as file:
+            file.write(self.summary() + "\n")
+
+
+class ProfiledSceneMixin:
+    """Profile every play/wait of a scene. Must come before the Scene in the bases."""
+
+    profile_dir = "profiles"
+
+    def __init__(self, *args, **kwargs):
+        self.profiler = PlayProfiler()
+        self._frames_rendered = 0
+        super().__init__(*args, **kwargs)
+
+    def setup(self):
+        super().setup()
+        renderer = self.renderer
+        add_frame = renderer.add_frame
+
+        # Only frames that reach the movie; update_frame also draws static backgrounds,
+        # and a frozen wait adds its frame once with num_frames copies
+        def counting_add_frame(frame, num_frames=1):
+            if not renderer.skip_animations:
+                self._frames_rendered += num_frames
+            return add_frame(frame, num_frames)
+
+        renderer.add_frame = counting_add_frame
+
+    def play(self, *args, **kwargs):
+        stack = call_stack(sys._getframe(1))
+        frames_before = self._frames_rendered
+        started = time.perf_counter()
+        super().play(*args, **kwargs)
+        wall_time = time.perf_counter() - started
+
+        animations = self.animations or []
+        is_wait = len(animations) == 1 and isinstance(animations[0], mn.Wait)
+        self.profiler.add(
+            {
+                "index": len(self.profiler.records),
+                "kind": "wait" if is_wait else "play",
+                "stack": stack,
+                "wall_time": wall_time,
+                "run_time": self.duration,
+                "frames": self._frames_rendered - frames_before,
+                "family_size": len(self.get_mobject_family_members()),
+                "animations": count_animations(animations),
+                "peak_rss_mb": peak_rss_mb(),
+            }
+        )
+
+    def tear_down(self):
+        super().tear_down()
+        self.profiler.write(self.profile_dir, type(self).__name__)
+
+
+def profiled(scene_class):
+    """Subclass of ``scene_class`` with ``ProfiledSceneMixin`` applied."""
+    return type(scene_class.__name__, (ProfiledSceneMixin, scene_class), {})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module")
+    parser.add_argument("scene")
+    parser.add_argument("--quality", default="low_quality")
+    args = parser.parse_args(argv)
+
+    mn.config.quality = args.quality
+    scene_class = getattr(importlib.import_module(args.module), args.scene)
+    scene = profiled(scene_class)()
+    scene.render()
+    print(scene.profiler.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
+from itertools import cycle
+
 import manim as mn
-from blocks import InputBlock, OutputBlock, DecisionBlock, create_elbow_arrow
+from blocks import InputBlock, OutputBlock, DecisionBlock, ArrowBatch, SharedCopyMixin, CachedBoundsMixin, cached_text, layout_pass, calculate_grid_layout, grid_offsets
+from static_layers import StaticLayerMixin
+from fast_hashing import FastHashMixin
 
 
-class MiniTree(mn.VGroup):
+class MiniTree(SharedCopyMixin, CachedBoundsMixin, mn.VGroup):
     def __init__(
         self, decision_settings: dict, output_settings: dict, caption: str, **kwargs
     ):
@@ -22,7 +26,7 @@ class MiniTree(mn.VGroup):
             OutputBlock(input_text=name, fill_color=color)
             for name, color in output_settings.items()
         ]
-        self.caption_block = mn.Text(caption, font_size=48)
+        self.caption_block = cached_text(caption, font_size=48)
         self.add(
             self.input_block,
             *self.decision_blocks,
@@ -33,17 +37,19 @@ class MiniTree(mn.VGroup):
         self._arrange_elements()
 
     def _arrange_elements(self):
-        # Position input block at the top
-        self.input_block.to_edge(mn.UP, buff=1)
-        self.decision_blocks[0].next_to(self.input_block, mn.DOWN, buff=1)
-
-        # Position output blocks
-        self.output_blocks[0].next_to(
-            self.decision_blocks[0], mn.DOWN + mn.LEFT, buff=1
-        )
-        self.output_blocks[1].next_to(
-            self.decision_blocks[0], mn.DOWN + mn.RIGHT, buff=1
-        )
+        # Blocks only move here, so their cached bounds move with them
+        with layout_pass():
+            # Position input block at the top
+            self.input_block.to_edge(mn.UP, buff=1)
+            self.decision_blocks[0].next_to(self.input_block, mn.DOWN, buff=1)
+
+            # Position output blocks
+            self.output_blocks[0].next_to(
+                self.decision_blocks[0], mn.DOWN + mn.LEFT, buff=1
+            )
+            self.output_blocks[1].next_to(
+                self.decision_blocks[0], mn.DOWN + mn.RIGHT, buff=1
+            )
 
         # Position caption block
         self.caption_block.next_to(
@@ -53,24 +59,55 @@ class MiniTree(mn.VGroup):
         )
 
         # Create arrows
-        self.arrows = []
         self._create_arrows()
 
     def _create_arrows(self):
-        # Arrow from input to each decision block
-        arrows = [
-            create_elbow_arrow(
-                self.input_block.get_bottom(), self.decision_blocks[0].get_top()
-            ),
-            create_elbow_arrow(
-                self.decision_blocks[0].get_left(), self.output_blocks[0].get_top()
-            ),
-            create_elbow_arrow(
-                self.decision_blocks[0].get_right(), self.output_blocks[1].get_top()
+        # Arrow from input to the decision block, then to each output block
+        self.arrow_batch = ArrowBatch(
+            [
+                self.input_block.get_bottom(),
+                self.decision_blocks[0].get_left(),
+                self.decision_blocks[0].get_right(),
+            ],
+            [
+                self.decision_blocks[0].get_top(),
+                self.output_blocks[0].get_top(),
+                self.output_blocks[1].get_top(),
+            ],
+        )
+        self.arrows = self.arrow_batch.views()
+        self.add(self.arrow_batch)
+
+    def relabel(self, decision_settings: dict, output_settings: dict, caption: str):
+        """Swap texts and colors in place, keeping the geometry of the tree."""
+        for block, (name, color) in zip(self.decision_blocks, decision_settings.items()):
+            block.set_text(name)
+            block[0].set_fill(color)
+        for block, (name, color) in zip(self.output_blocks, output_settings.items()):
+            block.set_text(name)
+            block[0].set_fill(color)
+
+        caption_block = cached_text(caption, font_size=48)
+        caption_block.scale(self.input_block.scale_ratio).move_to(self.caption_block)
+        self.submobjects[self.submobjects.index(self.caption_block)] = caption_block
+        self.caption_block = caption_block
+        return self
+
+    def path_animation(self, new_input: InputBlock, output_index: int = 1, color=mn.ORANGE):
+        """Single animation walking a copy of ``new_input`` down to one output block."""
+        new_input_copy = new_input.copy()
+        target_scale = self.input_block.height / new_input_copy.height
+        decision_block = self.decision_blocks[0]
+        return mn.Succession(
+            new_input_copy.animate.move_to(self.input_block).scale(target_scale),
+            self.arrows[0].animate.set_color(color),
+            mn.AnimationGroup(
+                decision_block[0].animate.set_fill(color),
+                decision_block[1].animate.set_color(mn.BLACK),
             ),
-        ]
-        self.arrows = arrows
-        self.add(*self.arrows)
+            self.arrows[1 + output_index].animate.set_color(color),
+            self.output_blocks[output_index].animate.scale(1.3),
+        )
 
 
 def calculate_scale_ratio(groups, camera, horizontal_buff=1, margin=0.9):
@@ -96,7 +133,58 @@ def calculate_scale_ratio(groups, camera, horizontal_buff=1, margin=0.9):
     return scale_factor, combined_group
 
 
-class RandomForestScene(mn.Scene):
+def build_forest(tree_settings, camera, buff=1, margin=0.9) -> mn.VGroup:
+    """
+    Stamp out one MiniTree per settings entry from a single template tree.
+
+    The template is built and laid out once, then moved from cell to cell. Each
+    instance is a shared copy taken once the template is in its cell, so it holds
+    the points of that cell without copying them, and shares every colour array
+    until it is relabelled. The last cell keeps the template itself.
+
+    Args:
+    tree_settings (list): (decision_settings, output_settings, caption) per tree.
+    camera: The camera object of the scene.
+    """
+    template = MiniTree(*tree_settings[0])
+    rows, cols, scale_factor = calculate_grid_layout(
+        len(tree_settings),
+        template.width,
+        template.height,
+        camera.frame_width,
+        camera.frame_height,
+        buff,
+        margin,
+    )
+    template.scale(scale_factor)
+
+    offsets = grid_offsets(
+        len(tree_settings),
+        rows,
+        cols,
+        template.width + buff * scale_factor,
+        template.height + buff * scale_factor,
+    )
+    position = template.get_center()
+
+    forest = mn.VGroup()
+    for i, (offset, settings) in enumerate(zip(offsets, tree_settings)):
+        cell = camera.frame_center + offset
+        template.shift(cell - position)
+        position = cell
+        tree = template if i == len(tree_settings) - 1 else template.copy()
+        forest.add(tree.relabel(*settings))
+    return forest
+
+
+FOREST_PRESETS = [
+    ({"Is it soft?": mn.LIGHT_GRAY}, {"Ripe": mn.RED, "Perfect": mn.GREEN}, "Softness Check"),
+    ({"Is it sweet?": mn.LIGHT_GRAY}, {"Perfect": mn.GREEN, "Unripe": mn.ORANGE}, "Sweetness Check"),
+    ({"Is it ripe": mn.LIGHT_GRAY}, {"Ripe": mn.RED, "Unripe": mn.ORANGE}, "Ripe check"),
+]
+
+
+class RandomForestScene(FastHashMixin, StaticLayerMixin, mn.Scene):
     def construct(self):
         self.camera.background_color = mn.BLUE_E
 
@@ -138,6 +226,8 @@ class RandomForestScene(mn.Scene):
 
         arranged_group.scale(scale_factor)
         arranged_group.move_to(self.camera.frame_center)
+        # Trees that are not being walked stay in the cached background
+        self.mark_static(forest1, forest2, forest3)
 
         self.play(
             mn.AnimationGroup(
@@ -173,27 +263,42 @@ class RandomForestScene(mn.Scene):
         )
 
     def _animate_tree(self, new_input: InputBlock, tree: MiniTree) -> OutputBlock:
-        new_input_copy = new_input.copy()
-        target_scale = tree.input_block.height / new_input_copy.height
-        self.play(new_input_copy.animate.move_to(tree.input_block).scale(target_scale))
+        self.play(tree.path_animation(new_input, output_index=1))
+        self.wait(1)
+        return tree.output_blocks[1]
 
-        input_to_decision_arrow = tree.arrows[0]
-        self.play(input_to_decision_arrow.animate.set_color(mn.ORANGE))
 
-        is_soft_block = tree.decision_blocks[0]
-        self.play(
-            is_soft_block[0].animate.set_fill(mn.ORANGE),
-            is_soft_block[1].animate.set_color(mn.BLACK),
-        )
+class InstancedForestScene(FastHashMixin, StaticLayerMixin, mn.Scene):
+    """Large forest stamped from one template tree and highlighted in a single play."""
 
-        decision_to_perfect_arrow = tree.arrows[2]  # Assuming it's the third arrow
-        self.play(decision_to_perfect_arrow.animate.set_color(mn.ORANGE))
+    n_trees = 100
 
-        perfect_block = tree.output_blocks[1]
-        self.play(perfect_block.animate.scale(1.3))
+    def construct(self):
+        self.camera.background_color = mn.BLUE_E
 
+        tree_settings = [
+            (decision_settings, output_settings, f"Tree {i + 1}: {caption}")
+            for i, (decision_settings, output_settings, caption) in zip(
+                range(self.n_trees), cycle(FOREST_PRESETS)
+            )
+        ]
+        forest = build_forest(tree_settings, self.camera)
+        self.mark_static(*forest)
+        self.play(mn.FadeIn(forest, lag_ratio=0.01))
         self.wait(1)
-        return perfect_block
+
+        new_input = InputBlock("New Input", fill_color=mn.ORANGE)
+        new_input.scale(forest[0].input_block.height * 1.25 / new_input.height)
+        new_input.move_to(self.camera.frame_center)
+        self.play(mn.FadeIn(new_input))
+
+        self.play(
+            mn.AnimationGroup(
+                *[tree.path_animation(new_input) for tree in forest],
+                lag_ratio=0.02,
+            )
+        )
+        self.wait(2)
 
 
 if __name__ == "__main__":
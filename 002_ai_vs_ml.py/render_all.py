@@ -0,0 +1,185 @@
+"""Render every scene of this package concurrently in a process pool.
+
+Usage:
+    python render_all.py --quality high_quality --scene-quality NeuronNetworkScene=low_quality
+
+Each scene renders in its own worker process with its own log file. A summary of
+wall time per scene is written to ``<log-dir>/render_summary.json``.
+"""
+import argparse
+import contextlib
+import importlib
+import inspect
+import json
+import logging
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+SUMMARY_NAME = "render_summary.json"
+# Scene modules; the tool modules next to them are never imported for discovery
+SCENE_MODULE_GLOBS = ("*_scene.py", "*_sceene.py")
+
+logger = logging.getLogger(__name__)
+
+
+def scene_modules(package_dir: Path = PACKAGE_DIR) -> list:
+    return sorted({path.stem for pattern in SCENE_MODULE_GLOBS for path in package_dir.glob(pattern)})
+
+
+def discover_scenes(package_dir: Path = PACKAGE_DIR, modules=None) -> list:
+    """(module_name, class_name) for every Scene subclass defining ``construct``.
+
+    Only ``modules`` are imported, by default the scene modules of ``package_dir``.
+    """
+    import manim as mn
+
+    scenes = []
+    for module_name in modules or scene_modules(package_dir):
+        module = importlib.import_module(module_name)
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+            if (
+                issubclass(cls, mn.Scene)
+                and cls.__module__ == module.__name__
+                and "construct" in cls.__dict__
+            ):
+                scenes.append((module.__name__, name))
+    return scenes
+
+
+def render_scene(module_name: str, class_name: str, quality: str, log_path: str) -> dict:
+    """Worker entry point: render one scene, logging to ``log_path``."""
+    started = time.perf_counter()
+    result = {"scene": class_name, "module": module_name, "quality": quality, "log": log_path}
+
+    with open(log_path, "w") as log_file, contextlib.redirect_stdout(
+        log_file
+    ), contextlib.redirect_stderr(log_file):
+        import manim as mn
+
+        manim_logger = logging.getLogger("manim")
+        manim_logger.handlers = [logging.StreamHandler(log_file)]
+        manim_logger.propagate = False
+        mn.config.quality = quality
+        mn.config.progress_bar = "none"
+
+        try:
+            scene_class = getattr(importlib.import_module(module_name), class_name)
+            scene_class().render()
+            result["status"] = "ok"
+        except Exception:
+            traceback.print_exc()
+            result["status"] = "failed"
+
+    result["wall_time"] = time.perf_counter() - started
+    return result
+
+
+def previous_wall_times(log_dir: Path) -> dict:
+    summary_path = log_dir / SUMMARY_NAME
+    if not summary_path.exists():
+        return {}
+    with open(summary_path) as file:
+        return {entry["scene"]: entry["wall_time"] for entry in json.load(file)["scenes"]}
+
+
+def render_all(scenes, quality: str, scene_quality: dict, log_dir: Path, max_workers=None) -> dict:
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    # Longest scenes first so the slowest one never starts last
+    last_times = previous_wall_times(log_dir)
+    scenes = sorted(scenes, key=lambda scene: -last_times.get(scene[1], float("inf")))
+
+    started = time.perf_counter()
+    results = []
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+        futures = {}
+        for module_name, class_name in scenes:
+            scene_args = (
+                module_name,
+                class_name,
+                scene_quality.get(class_name, quality),
+                str(log_dir / f"{class_name}.log"),
+            )
+            futures[pool.submit(render_scene, *scene_args)] = scene_args
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as error:
+                # A crashed worker breaks the pool; report it with every other scene
+                module_name, class_name, scene_quality_name, log_path = futures[future]
+                result = {
+                    "scene": class_name,
+                    "module": module_name,
+                    "quality": scene_quality_name,
+                    "log": log_path,
+                    "status": "failed",
+                    "error": repr(error),
+                    "wall_time": time.perf_counter() - started,
+                }
+            logger.info("%s %s in %.1fs", result["scene"], result["status"], result["wall_time"])
+            results.append(result)
+
+    summary = {
+        "wall_time": time.perf_counter() - started,
+        "serial_time": sum(result["wall_time"] for result in results),
+        "scenes": sorted(results, key=lambda result: -result["wall_time"]),
+    }
+    with open(log_dir / SUMMARY_NAME, "w") as file:
+        json.dump(summary, file, indent=2)
+    return summary
+
+
+def parse_scene_quality(items) -> dict:
+    scene_quality = {}
+    for item in items:
+        scene, _, quality = item.partition("=")
+        if not quality:
+            raise argparse.ArgumentTypeError(f"Expected SCENE=QUALITY, got {item!r}")
+        scene_quality[scene] = quality
+    return scene_quality
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quality", default="high_quality")
+    parser.add_argument(
+        "--scene-quality",
+        action="append",
+        default=[],
+        metavar="SCENE=QUALITY",
+        help="Per-scene quality override, may be repeated.",
+    )
+    parser.add_argument("--scenes", nargs="*", help="Only render these scene classes.")
+    parser.add_argument(
+        "--modules", nargs="*", help="Scene modules to search, by default every *_scene module."
+    )
+    parser.add_argument("--log-dir", type=Path, default=PACKAGE_DIR / "render_logs")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    scenes = discover_scenes(modules=args.modules)
+    if args.scenes:
+        scenes = [scene for scene in scenes if scene[1] in args.scenes]
+
+    summary = render_all(
+        scenes,
+        args.quality,
+        parse_scene_quality(args.scene_quality),
+        args.log_dir,
+        max_workers=args.workers,
+    )
+    for result in summary["scenes"]:
+        print(f"{result['wall_time']:8.1f}s  {result['status']:6}  {result['scene']} ({result['quality']})")
+    print(f"{summary['wall_time']:8.1f}s  total wall time ({summary['serial_time']:.1f}s if serial)")
+    return 0 if all(result["status"] == "ok" for result in summary["scenes"]) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,211 @@
+"""Long-lived render server that keeps manim imported and fonts warm between renders.
+
+Usage:
+    python render_server.py serve                       # listen on 127.0.0.1:8765
+    python render_server.py render NeuronNetworkScene   # ask the running server to render
+    python render_server.py watch DecisionTree FittedDecisionTree
+
+Before every render the modules of this package whose files changed are
+reloaded, together with the modules importing them. Play calls whose inputs did
+not change are served from manim's partial movie cache, so only edited
+animations are rasterized again. ``watch`` runs the server loop in-process and
+re-renders its scenes whenever a ``*.py`` file of the package is saved.
+"""
+import argparse
+import importlib
+import json
+import logging
+import socketserver
+import sys
+import time
+import traceback
+import types
+from pathlib import Path
+
+import manim as mn
+
+from blocks import cached_text
+from render_all import PACKAGE_DIR, discover_scenes
+
+DEFAULT_PORT = 8765
+
+logger = logging.getLogger(__name__)
+
+
+def _source_files(package_dir: Path) -> dict:
+    """Modification time of every Python file of the package."""
+    return {path: path.stat().st_mtime for path in package_dir.rglob("*.py")}
+
+
+def _local_modules(package_dir: Path) -> dict:
+    """Imported modules of this package, by name."""
+    modules = {}
+    for name, module in list(sys.modules.items()):
+        # Never reload the running server itself
+        if name in ("__main__", __name__):
+            continue
+        path = getattr(module, "__file__", None)
+        if path and Path(path).resolve().is_relative_to(package_dir):
+            modules[name] = module
+    return modules
+
+
+def _local_imports(module, local_names) -> set:
+    """Names of the local modules ``module`` takes modules, classes or functions from."""
+    imports = set()
+    for value in vars(module).values():
+        if isinstance(value, types.ModuleType):
+            source = value.__name__
+        else:
+            source = getattr(value, "__module__", None)
+        if source in local_names and source != module.__name__:
+            imports.add(source)
+    return imports
+
+
+class RenderServer:
+    """Renders scenes of the package in this process, reloading edited modules first."""
+
+    def __init__(self, package_dir: Path = PACKAGE_DIR, quality: str = "low_quality"):
+        self.package_dir = Path(package_dir).resolve()
+        self.quality = quality
+        self._mtimes = _source_files(self.package_dir)
+        self._scenes = dict((name, module) for module, name in discover_scenes(self.package_dir))
+        # Pango font lookup happens on the first Text, do it before the first request
+        cached_text("warm up")
+
+    def changed_files(self) -> list:
+        mtimes = _source_files(self.package_dir)
+        changed = [path for path, mtime in mtimes.items() if self._mtimes.get(path) != mtime]
+        self._mtimes = mtimes
+        return changed
+
+    def reload_changed(self) -> list:
+        """Reload edited modules and their importers; returns the reloaded module names."""
+        changed = {path.resolve() for path in self.changed_files()}
+        if not changed:
+            return []
+
+        modules = _local_modules(self.package_dir)
+        imports = {name: _local_imports(module, modules) for name, module in modules.items()}
+        stale = {name for name, module in modules.items() if Path(module.__file__).resolve() in changed}
+        # Importers of stale modules hold references to the old classes, reload them too
+        while True:
+            importers = {name for name, used in imports.items() if used & stale} - stale
+            if not importers:
+                break
+            stale |= importers
+
+        reloaded = []
+        while stale:
+            # Dependencies first, so importers pick up the fresh definitions
+            ready = sorted(name for name in stale if not imports[name] & stale) or sorted(stale)[:1]
+            for name in ready:
+                importlib.reload(modules[name])
+                reloaded.append(name)
+            stale -= set(ready)
+
+        new_files = changed - {Path(module.__file__).resolve() for module in modules.values()}
+        if new_files or reloaded:
+            self._scenes = dict((name, module) for module, name in discover_scenes(self.package_dir))
+        return reloaded
+
+    def resolve(self, scene: str) -> tuple:
+        """(module, class name) for ``Scene`` or ``module.Scene``."""
+        module_name, _, class_name = scene.rpartition(".")
+        if module_name:
+            return module_name, class_name
+        if scene not in self._scenes:
+            raise KeyError(f"Unknown scene {scene!r}, known scenes: {', '.join(sorted(self._scenes))}")
+        return self._scenes[scene], scene
+
+    def render(self, scene: str, quality: str = None) -> dict:
+        started = time.perf_counter()
+        result = {"scene": scene, "quality": quality or self.quality}
+        try:
+            result["reloaded"] = self.reload_changed()
+            module_name, class_name = self.resolve(scene)
+            scene_class = getattr(importlib.import_module(module_name), class_name)
+            with mn.tempconfig({"quality": result["quality"], "disable_caching": False}):
+                instance = scene_class()
+                instance.render()
+            result["movie"] = str(instance.renderer.file_writer.movie_file_path)
+            result["status"] = "ok"
+        except Exception:
+            result["status"] = "failed"
+            result["error"] = traceback.format_exc()
+        result["wall_time"] = time.perf_counter() - started
+        return result
+
+    def watch(self, scenes, interval: float = 0.5):
+        """Re-render ``scenes`` every time a source file of the package is saved."""
+        for scene in scenes:
+            _log_result(self.render(scene))
+        while True:
+            time.sleep(interval)
+            if any(self._mtimes.get(path) != mtime for path, mtime in _source_files(self.package_dir).items()):
+                for scene in scenes:
+                    _log_result(self.render(scene))
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """One JSON request per line: ``{"scene": ..., "quality": ...}``."""
+
+    def handle(self):
+        for line in self.rfile:
+            request = json.loads(line)
+            result = self.server.render_server.render(request["scene"], request.get("quality"))
+            _log_result(result)
+            self.wfile.write((json.dumps(result) + "\n").encode())
+
+
+def serve(port: int = DEFAULT_PORT, quality: str = "low_quality"):
+    with socketserver.TCPServer(("127.0.0.1", port), _RequestHandler) as server:
+        server.render_server = RenderServer(quality=quality)
+        logger.info("Render server listening on 127.0.0.1:%d", port)
+        server.serve_forever()
+
+
+def request_render(scene: str, quality: str = None, port: int = DEFAULT_PORT) -> dict:
+    """Client side: render ``scene`` on the running server and wait for the result."""
+    import socket
+
+    with socket.create_connection(("127.0.0.1", port)) as connection:
+        connection.sendall((json.dumps({"scene": scene, "quality": quality}) + "\n").encode())
+        with connection.makefile() as reply:
+            return json.loads(reply.readline())
+
+
+def _log_result(result: dict):
+    if result["status"] == "ok":
+        reloaded = ", ".join(result["reloaded"]) or "nothing"
+        logger.info("%s rendered in %.2fs (reloaded %s)", result["scene"], result["wall_time"], reloaded)
+    else:
+        logger.error("%s failed:\n%s", result["scene"], result["error"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--quality", default=None)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve")
+    commands.add_parser("render").add_argument("scenes", nargs="+")
+    commands.add_parser("watch").add_argument("scenes", nargs="+")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.command == "serve":
+        serve(args.port, args.quality or "low_quality")
+    elif args.command == "watch":
+        RenderServer(quality=args.quality or "low_quality").watch(args.scenes)
+    else:
+        results = [request_render(scene, args.quality, args.port) for scene in args.scenes]
+        for result in results:
+            print(result.get("movie") or result["error"])
+        return 0 if all(result["status"] == "ok" for result in results) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
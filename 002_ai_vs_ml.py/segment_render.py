@@ -0,0 +1,171 @@
+"""Render one long scene as contiguous ranges of play calls in parallel, then stitch.
+
+Usage:
+    python segment_render.py neural_network_sceene NeuronNetworkScene --segments 8
+
+A first pass runs ``construct`` with every animation skipped to record the
+timeline. Each worker then fast-forwards (no rasterization) to the start of its
+segment via ``from_animation_number`` and ends the scene when its last play is done.
+The segment movies are remuxed in order into ``<Scene>.mp4`` without re-encoding,
+so the result holds exactly the frames of a serial render.
+"""
+import argparse
+import importlib
+import io
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def _load_scene_class(module_name: str, class_name: str):
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def record_timeline(module_name: str, class_name: str) -> list:
+    """Run time of every play/wait call, found by running ``construct`` fully skipped."""
+    import manim as mn
+
+    scene_class = _load_scene_class(module_name, class_name)
+    durations = []
+
+    def play(self, *args, **kwargs):
+        scene_class.play(self, *args, **kwargs)
+        durations.append(self.duration)
+
+    recorder = type(class_name, (scene_class,), {"play": play})
+    with mn.tempconfig(
+        {
+            "from_animation_number": sys.maxsize,
+            "write_to_movie": False,
+            "save_last_frame": False,
+            "progress_bar": "none",
+        }
+    ):
+        recorder().render()
+    return durations
+
+
+def split_timeline(durations: list, n_segments: int) -> list:
+    """Contiguous [start, end) play ranges with roughly equal run time each."""
+    n_segments = max(1, min(n_segments, len(durations)))
+    total = sum(durations)
+    bounds = [0]
+    elapsed = 0.0
+    for index, duration in enumerate(durations):
+        elapsed += duration
+        remaining_plays = len(durations) - index - 1
+        remaining_segments = n_segments - len(bounds)
+        if (
+            remaining_segments > 0
+            and elapsed >= total * len(bounds) / n_segments
+            and remaining_plays >= remaining_segments
+        ):
+            bounds.append(index + 1)
+    bounds.append(len(durations))
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def segment_scene_class(scene_class, end: int):
+    """``scene_class`` ending the scene before play ``end`` starts.
+
+    ``upto_animation_number`` cannot express this for ``end == 1``: manim reads
+    an upper bound of 0 as no bound at all.
+    """
+    from manim.utils.exceptions import EndSceneEarlyException
+
+    def play(self, *args, **kwargs):
+        if self.renderer.num_plays >= end:
+            raise EndSceneEarlyException()
+        scene_class.play(self, *args, **kwargs)
+
+    return type(scene_class.__name__, (scene_class,), {"play": play})
+
+
+def render_segment(module_name: str, class_name: str, quality: str, start: int, end: int) -> str:
+    """Worker entry point: render plays ``start`` to ``end - 1`` into their own movie."""
+    import manim as mn
+
+    logging.getLogger("manim").setLevel(logging.WARNING)
+    mn.config.quality = quality
+    mn.config.progress_bar = "none"
+    mn.config.from_animation_number = start
+    mn.config.output_file = f"{class_name}_plays_{start:05d}_{end - 1:05d}"
+
+    scene = segment_scene_class(_load_scene_class(module_name, class_name), end)()
+    scene.render()
+    return str(scene.renderer.file_writer.movie_file_path)
+
+
+def concat_movies(segment_files: list, output_file: Path) -> None:
+    """Remux the segment movies back to back without re-encoding."""
+    import av
+
+    manifest = io.BytesIO(
+        "".join(f"file 'file:{Path(path).as_posix()}'\n" for path in segment_files).encode()
+    )
+    source = av.open(manifest, format="concat", options={"safe": "0"})
+    source_stream = source.streams.video[0]
+    output = av.open(str(output_file), mode="w")
+    if hasattr(output, "add_stream_from_template"):
+        output_stream = output.add_stream_from_template(source_stream)
+    else:
+        output_stream = output.add_stream(template=source_stream)
+
+    for packet in source.demux(source_stream):
+        # Skip the flushing packets and let libav recompute decode timestamps
+        if packet.dts is None:
+            continue
+        packet.dts = None
+        packet.stream = output_stream
+        output.mux(packet)
+
+    source.close()
+    output.close()
+
+
+def segment_render(module_name, class_name, quality="high_quality", n_segments=None) -> Path:
+    started = time.perf_counter()
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        # Recording imports the scene module, keep that out of this process
+        durations = pool.submit(record_timeline, module_name, class_name).result()
+
+    segments = split_timeline(durations, n_segments or os.cpu_count())
+    logger.info(
+        "%s: %d plays, %.1fs of animation, %d segments",
+        class_name, len(durations), sum(durations), len(segments),
+    )
+
+    with ProcessPoolExecutor(max_workers=len(segments), mp_context=context) as pool:
+        futures = [
+            pool.submit(render_segment, module_name, class_name, quality, start, end)
+            for start, end in segments
+        ]
+        segment_files = [future.result() for future in futures]
+
+    output_file = Path(segment_files[0]).with_name(f"{class_name}.mp4")
+    concat_movies(segment_files, output_file)
+    logger.info("%s written in %.1fs", output_file, time.perf_counter() - started)
+    return output_file
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module")
+    parser.add_argument("scene")
+    parser.add_argument("--quality", default="high_quality")
+    parser.add_argument("--segments", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    print(segment_render(args.module, args.scene, args.quality, args.segments))
+
+
+if __name__ == "__main__":
+    main()
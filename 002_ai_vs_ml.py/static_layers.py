@@ -0,0 +1,107 @@
+import zlib
+
+import numpy as np
+from manim.utils.family import extract_mobject_family_members
+
+# Per-mobject arrays that change whenever a mobject is moved or restyled
+_FINGERPRINT_ATTRS = ("points", "fill_rgbas", "stroke_rgbas", "rgbas")
+
+
+def _animation_families(animations) -> set:
+    mobjects = set()
+    for animation in animations:
+        mobjects.update(animation.mobject.get_family())
+        mobjects.update(_animation_families(getattr(animation, "animations", [])))
+    return mobjects
+
+
+def fingerprint(mobjects) -> int:
+    """Cheap checksum of the geometry and style of ``mobjects`` and all their members.
+
+    Containers usually hold no points themselves, so every family member is
+    digested. No arrays are copied.
+    """
+    checksum = 1
+    for mob in extract_mobject_family_members(mobjects):
+        checksum = zlib.adler32(id(mob).to_bytes(8, "little"), checksum)
+        for attr in _FINGERPRINT_ATTRS:
+            array = getattr(mob, attr, None)
+            if isinstance(array, np.ndarray) and array.size:
+                checksum = zlib.adler32(memoryview(np.ascontiguousarray(array)).cast("B"), checksum)
+        checksum = zlib.adler32(str(getattr(mob, "stroke_width", "")).encode(), checksum)
+    return checksum
+
+
+class StaticLayerMixin:
+    """Rasterize subgroups marked static once and reuse the bitmap across play calls.
+
+    Manim already draws non-moving mobjects into a background image per play,
+    but everything after the first animated mobject in z-order counts as moving.
+    Groups passed to ``mark_static`` stay in the background unless one of their
+    own members is animated, and the background is only redrawn when the
+    fingerprint of its mobjects changes. Static groups are composited beneath
+    the moving mobjects, so a group only stays static while it comes before
+    every moving mobject in the scene. Must come before the Scene in the bases.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._static_layers = []
+        self._static_cache_key = None
+        self._static_cache_image = None
+        super().__init__(*args, **kwargs)
+
+    def mark_static(self, *mobjects):
+        self._static_layers.extend(mobjects)
+        return self
+
+    def unmark_static(self, *mobjects):
+        for mob in mobjects:
+            self._static_layers.remove(mob)
+        return self
+
+    def setup(self):
+        super().setup()
+        save_static_frame_data = self.renderer.save_static_frame_data
+
+        def cached_save_static_frame_data(scene, static_mobjects):
+            if not static_mobjects:
+                return save_static_frame_data(scene, static_mobjects)
+            key = (str(self.camera.background_color), fingerprint(static_mobjects))
+            if key != self._static_cache_key:
+                self._static_cache_image = save_static_frame_data(scene, static_mobjects)
+                self._static_cache_key = key
+            self.renderer.static_image = self._static_cache_image
+            return self._static_cache_image
+
+        self.renderer.save_static_frame_data = cached_save_static_frame_data
+
+    def get_moving_mobjects(self, *animations):
+        moving = super().get_moving_mobjects(*animations)
+        if not self._static_layers:
+            return moving
+
+        animated = _animation_families(animations)
+        candidates = [
+            family
+            for family in (layer.get_family() for layer in self._static_layers)
+            if not animated.intersection(family) and not any(mob.updaters for mob in family)
+        ]
+        # Static layers are drawn beneath everything moving, so only layers that
+        # already come before the first moving mobject keep the scene's z-order
+        in_candidates = set().union(*candidates)
+        first_moving = next(
+            (
+                i
+                for i, mob in enumerate(moving)
+                if mob not in in_candidates and mob.has_points()
+            ),
+            len(moving),
+        )
+        position = {mob: i for i, mob in enumerate(moving)}
+        static = set()
+        for family in candidates:
+            if all(position.get(mob, -1) < first_moving for mob in family):
+                static.update(family)
+        # Containers are dropped too, or their families would bring the static
+        # members back; their moving descendants are listed on their own
+        return [mob for mob in moving if static.isdisjoint(mob.get_family())]
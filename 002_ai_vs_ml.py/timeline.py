@@ -0,0 +1,387 @@
+"""Compile a scene's timeline to memory-mapped keyframe files and replay it without running construct.
+
+Usage:
+    python timeline.py compile neural_network_sceene NeuronNetworkScene
+    python timeline.py replay media/timelines/NeuronNetworkScene --resolution 3840x2160
+
+``compile`` runs ``construct`` once without rasterizing anything and records the
+drawn VMobjects and point clouds of every play segment (waits included). A segment holding a single state (a
+wait) is stored as one keyframe. A segment whose frames all lie on the line
+from its first to its last state (moves, fades, recolouring) is stored as those
+two keyframes plus one interpolation alpha per frame. Anything else (``Create``,
+arcs, updaters) gets one keyframe per frame. Arrays are appended to flat binary
+files described by ``timeline.json``.
+
+``replay`` maps those files with ``np.memmap`` and rasterizes each frame through
+one scratch VMobject and PMobject, so no mobjects are rebuilt, startup only reads the JSON
+index, and memory use does not grow with the length of the scene. Resolution
+and background colour can differ from the compiled run.
+"""
+import argparse
+import importlib
+import json
+import logging
+from pathlib import Path
+
+import manim as mn
+import numpy as np
+
+from multi_resolution import ResolutionTarget, parse_resolution
+
+logger = logging.getLogger(__name__)
+
+# Name -> (dtype, columns) of the flat arrays a timeline consists of
+TIMELINE_ARRAYS = {
+    "points": (np.float32, 3),
+    "fill_rgbas": (np.float32, 4),
+    "stroke_rgbas": (np.float32, 4),
+    "background_stroke_rgbas": (np.float32, 4),
+    # Row ranges into the four arrays above, joint and cap style indices, leaf kind
+    "leaves": (np.int64, 11),
+    # Stroke width (point thickness of point clouds), background stroke width, sheen direction
+    "leaf_styles": (np.float32, 5),
+    # Row range into leaves
+    "keyframes": (np.int64, 2),
+    # Keyframe and number of frames of each run of identical frames
+    "frames": (np.int64, 2),
+    # Interpolation towards the next keyframe, 0 for none
+    "alphas": (np.float32, 1),
+}
+LEAF_ARRAYS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+JOINT_TYPES = list(mn.LineJointType)
+CAP_STYLES = list(mn.CapStyleType)
+
+HOLD, INTERPOLATE, FRAMES = "hold", "interpolate", "frames"
+# Leaf kinds; point clouds keep their rgbas in the fill_rgbas rows
+VECTOR, POINT_CLOUD = 0, 1
+
+
+def snapshot(camera, mobjects) -> dict:
+    """Drawn state of ``mobjects``: leaf arrays concatenated in display order.
+
+    Raises ``TypeError`` for drawn mobjects replay cannot draw, such as images.
+    """
+    leaves = camera.get_mobjects_to_display(mobjects)
+    arrays = {name: [] for name in LEAF_ARRAYS}
+    layout = np.zeros((len(leaves), len(LEAF_ARRAYS) + 3), dtype=np.int64)
+    styles = np.zeros((len(leaves), 5), dtype=np.float32)
+    no_rgbas = np.zeros((0, 4))
+    for i, leaf in enumerate(leaves):
+        if isinstance(leaf, mn.VMobject) and not leaf.get_background_image():
+            leaf_arrays = (
+                leaf.points,
+                leaf.get_fill_rgbas(),
+                leaf.get_stroke_rgbas(),
+                leaf.get_stroke_rgbas(background=True),
+            )
+            layout[i, -3] = JOINT_TYPES.index(leaf.joint_type)
+            layout[i, -2] = CAP_STYLES.index(leaf.cap_style)
+            layout[i, -1] = VECTOR
+            styles[i, :2] = leaf.get_stroke_width(), leaf.get_stroke_width(background=True)
+            styles[i, 2:] = leaf.get_sheen_direction()
+        elif isinstance(leaf, mn.PMobject):
+            leaf_arrays = (leaf.points, leaf.rgbas, no_rgbas, no_rgbas)
+            layout[i, -1] = POINT_CLOUD
+            styles[i, 0] = leaf.stroke_width
+        else:
+            raise TypeError(f"Timelines cannot record {type(leaf).__name__} mobjects")
+        for j, (name, array) in enumerate(zip(LEAF_ARRAYS, leaf_arrays)):
+            arrays[name].append(array)
+            layout[i, j] = len(array)
+
+    state = {"layout": layout, "leaf_styles": styles}
+    for name, columns in zip(LEAF_ARRAYS, (3, 4, 4, 4)):
+        parts = arrays[name]
+        state[name] = (
+            np.concatenate(parts).astype(np.float32) if parts else np.zeros((0, columns), np.float32)
+        )
+    return state
+
+
+def _flat(state) -> np.ndarray:
+    return np.concatenate(
+        [state[name].ravel() for name in (*LEAF_ARRAYS, "leaf_styles")]
+    ).astype(float)
+
+
+def _same_structure(a, b) -> bool:
+    return np.array_equal(a["layout"], b["layout"])
+
+
+def fit_line(states, tolerance: float = 1e-4):
+    """Alphas placing every state on the line from the first to the last one, or None."""
+    if not all(_same_structure(states[0], state) for state in states):
+        return None
+    start = _flat(states[0])
+    delta = _flat(states[-1]) - start
+    norm = delta @ delta
+    if norm == 0:
+        return None
+    alphas = []
+    for state in states:
+        offset = _flat(state) - start
+        alpha = offset @ delta / norm
+        if np.abs(offset - alpha * delta).max() > tolerance:
+            return None
+        alphas.append(alpha)
+    return alphas
+
+
+class TimelineWriter:
+    """Append keyframes and frame runs to the flat files of a timeline directory."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._files = {name: open(self.path / f"{name}.bin", "wb") for name in TIMELINE_ARRAYS}
+        self.rows = dict.fromkeys(TIMELINE_ARRAYS, 0)
+        self.segments = []
+
+    def append(self, name: str, array) -> int:
+        """Write rows to ``name``; returns the index of the first one."""
+        dtype, columns = TIMELINE_ARRAYS[name]
+        array = np.ascontiguousarray(array, dtype=dtype).reshape(-1, columns)
+        start = self.rows[name]
+        self._files[name].write(array.tobytes())
+        self.rows[name] += len(array)
+        return start
+
+    def add_keyframe(self, state) -> int:
+        layout = state["layout"]
+        leaves = np.zeros((len(layout), TIMELINE_ARRAYS["leaves"][1]), dtype=np.int64)
+        for j, name in enumerate(LEAF_ARRAYS):
+            ends = np.cumsum(layout[:, j]) + self.append(name, state[name])
+            leaves[:, 2 * j] = ends - layout[:, j]
+            leaves[:, 2 * j + 1] = ends
+        leaves[:, 2 * len(LEAF_ARRAYS) :] = layout[:, len(LEAF_ARRAYS) :]
+        leaf_start = self.append("leaves", leaves)
+        self.append("leaf_styles", state["leaf_styles"])
+        return self.append("keyframes", [leaf_start, leaf_start + len(leaves)])
+
+    def add_frames(self, keyframe: int, num_frames: int, alpha: float = 0.0):
+        self.append("frames", [keyframe, num_frames])
+        self.append("alphas", alpha)
+
+    def add_segment(self, frames):
+        """Store one play segment, given as ``(state, num_frames)`` pairs."""
+        # Merge runs of identical frames first
+        runs = []
+        for state, num_frames in frames:
+            if runs and _same_structure(runs[-1][0], state) and np.array_equal(
+                _flat(runs[-1][0]), _flat(state)
+            ):
+                runs[-1][1] += num_frames
+            else:
+                runs.append([state, num_frames])
+        if not runs:
+            return
+
+        states = [state for state, _ in runs]
+        alphas = fit_line(states) if len(runs) > 1 else None
+        if len(runs) == 1:
+            kind, n_keyframes = HOLD, 1
+            self.add_frames(self.add_keyframe(states[0]), runs[0][1])
+        elif alphas is not None:
+            kind, n_keyframes = INTERPOLATE, 2
+            keyframe = self.add_keyframe(states[0])
+            self.add_keyframe(states[-1])
+            for (_, num_frames), alpha in zip(runs, alphas):
+                self.add_frames(keyframe, num_frames, alpha)
+        else:
+            kind, n_keyframes = FRAMES, len(runs)
+            for state, num_frames in runs:
+                self.add_frames(self.add_keyframe(state), num_frames)
+        self.segments.append(
+            {"kind": kind, "frames": sum(n for _, n in runs), "keyframes": n_keyframes}
+        )
+
+    def close(self, **meta):
+        for file in self._files.values():
+            file.close()
+        index = {"rows": self.rows, "segments": self.segments, **meta}
+        (self.path / "timeline.json").write_text(json.dumps(index, indent=1))
+
+
+class TimelineRecorderMixin:
+    """Record the scene to ``timeline_path`` instead of rendering it. Must come before the Scene in the bases."""
+
+    timeline_path = "media/timelines"
+
+    def setup(self):
+        super().setup()
+        renderer = self.renderer
+        camera = self.camera
+        self.timeline = TimelineWriter(self.timeline_path)
+        self._segment_frames = []
+        file_writer = renderer.file_writer
+        end_animation = file_writer.end_animation
+
+        def record_end_animation(*args, **kwargs):
+            # Every play ends here, including frozen waits that skip play_internal
+            self.timeline.add_segment(self._segment_frames)
+            self._segment_frames = []
+            return end_animation(*args, **kwargs)
+
+        def record_add_frame(frame, num_frames=1):
+            if renderer.skip_animations:
+                return
+            renderer.time += num_frames / camera.frame_rate
+            self._segment_frames.append((snapshot(camera, self.mobjects), num_frames))
+
+        # Nothing is rasterized while compiling; frames are snapshots of the mobjects
+        renderer.update_frame = lambda *args, **kwargs: None
+        renderer.render = lambda scene, time, moving_mobjects=None: record_add_frame(None)
+        renderer.add_frame = record_add_frame
+        file_writer.end_animation = record_end_animation
+
+    def tear_down(self):
+        super().tear_down()
+        self.timeline.add_segment(self._segment_frames)
+        self._segment_frames = []
+        self.timeline.close(
+            scene=type(self).__name__,
+            frame_rate=self.camera.frame_rate,
+            pixel_width=self.camera.pixel_width,
+            pixel_height=self.camera.pixel_height,
+            background_color=mn.ManimColor(self.camera.background_color).to_hex(),
+            background_opacity=self.camera.background_opacity,
+        )
+
+
+def compile_timeline(module_name, class_name, output_dir="media/timelines", quality="high_quality") -> Path:
+    """Run ``construct`` of a scene once and write its timeline; returns the timeline directory."""
+    scene_class = getattr(importlib.import_module(module_name), class_name)
+    path = Path(output_dir) / class_name
+    recorder_class = type(class_name, (TimelineRecorderMixin, scene_class), {"timeline_path": path})
+    with mn.tempconfig(
+        {
+            "quality": quality,
+            "disable_caching": True,
+            "write_to_movie": False,
+            "save_last_frame": False,
+        }
+    ):
+        recorder_class().render()
+    return path
+
+
+class TimelinePlayer:
+    """Rasterize the frames of a compiled timeline straight from its memory-mapped files."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.index = json.loads((self.path / "timeline.json").read_text())
+        self.arrays = {}
+        for name, (dtype, columns) in TIMELINE_ARRAYS.items():
+            rows = self.index["rows"][name]
+            # np.memmap refuses empty files
+            self.arrays[name] = (
+                np.memmap(self.path / f"{name}.bin", dtype=dtype, mode="r", shape=(rows, columns))
+                if rows
+                else np.zeros((0, columns), dtype=dtype)
+            )
+        self._carrier = mn.VMobject()
+        self._point_carrier = mn.PMobject()
+
+    @property
+    def n_frames(self) -> int:
+        return int(self.arrays["frames"][:, 1].sum())
+
+    def keyframe_state(self, keyframe: int, alpha: float = 0.0):
+        """Leaf rows relative to the returned arrays, their styles and the leaf arrays."""
+        leaf_start, leaf_end = self.arrays["keyframes"][keyframe]
+        leaves = np.array(self.arrays["leaves"][leaf_start:leaf_end])
+        styles = np.array(self.arrays["leaf_styles"][leaf_start:leaf_end], dtype=float)
+        if alpha:
+            next_start, next_end = self.arrays["keyframes"][keyframe + 1]
+            next_styles = self.arrays["leaf_styles"][next_start:next_end]
+            styles += alpha * (next_styles - styles)
+            next_leaves = self.arrays["leaves"][next_start:next_end]
+
+        arrays = {}
+        for j, name in enumerate(LEAF_ARRAYS):
+            if not len(leaves):
+                arrays[name] = np.zeros((0, TIMELINE_ARRAYS[name][1]))
+                continue
+            start, end = leaves[0, 2 * j], leaves[-1, 2 * j + 1]
+            array = np.array(self.arrays[name][start:end], dtype=float)
+            if alpha:
+                next_begin = next_leaves[0, 2 * j]
+                array += alpha * (self.arrays[name][next_begin:next_begin + end - start] - array)
+            arrays[name] = array
+            leaves[:, 2 * j : 2 * j + 2] -= start
+        return leaves, styles, arrays
+
+    def draw(self, camera, keyframe: int, alpha: float = 0.0):
+        """Rasterize one keyframe, or the interpolation towards the next one, on ``camera``."""
+        camera.reset()
+        ctx = camera.get_cairo_context(camera.pixel_array)
+        leaves, styles, arrays = self.keyframe_state(keyframe, alpha)
+        carrier = self._carrier
+        for rows, style in zip(leaves, styles):
+            if rows[10] == POINT_CLOUD:
+                camera.display_point_cloud(
+                    self._point_carrier,
+                    arrays["points"][rows[0] : rows[1]],
+                    arrays["fill_rgbas"][rows[2] : rows[3]],
+                    camera.adjusted_thickness(style[0]),
+                    camera.pixel_array,
+                )
+                continue
+            for j, name in enumerate(LEAF_ARRAYS):
+                setattr(carrier, name, arrays[name][rows[2 * j] : rows[2 * j + 1]])
+            carrier.stroke_width, carrier.background_stroke_width = style[0], style[1]
+            carrier.sheen_direction = style[2:]
+            carrier.joint_type = JOINT_TYPES[rows[8]]
+            carrier.cap_style = CAP_STYLES[rows[9]]
+            camera.display_vectorized(carrier, ctx)
+
+    def frames(self, camera):
+        """Yield ``(pixel_array, num_frames)`` for every run of frames, in order."""
+        for (keyframe, num_frames), alpha in zip(self.arrays["frames"], self.arrays["alphas"][:, 0]):
+            self.draw(camera, keyframe, float(alpha))
+            yield camera.pixel_array, int(num_frames)
+
+    def render(self, movie_path, resolution=None, background_color=None) -> Path:
+        """Encode the timeline to ``movie_path``, by default at the compiled resolution."""
+        width, height = resolution or (self.index["pixel_width"], self.index["pixel_height"])
+        target = ResolutionTarget(width, height, self.index["frame_rate"], Path(movie_path))
+        target.camera.background_color = background_color or self.index["background_color"]
+        target.camera.background_opacity = self.index["background_opacity"]
+        for _, num_frames in self.frames(target.camera):
+            target.encode(num_frames)
+        target.close()
+        return target.path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = commands.add_parser("compile", help="Run construct once and write the timeline.")
+    compile_parser.add_argument("module")
+    compile_parser.add_argument("scene")
+    compile_parser.add_argument("--quality", default="high_quality")
+    compile_parser.add_argument("--output-dir", default="media/timelines")
+
+    replay_parser = commands.add_parser("replay", help="Rasterize a compiled timeline to a movie.")
+    replay_parser.add_argument("timeline")
+    replay_parser.add_argument("--output", default=None)
+    replay_parser.add_argument("--resolution", type=parse_resolution, default=None, metavar="WIDTHxHEIGHT")
+    replay_parser.add_argument("--background-color", default=None)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.command == "compile":
+        path = compile_timeline(args.module, args.scene, args.output_dir, args.quality)
+        for segment in json.loads((path / "timeline.json").read_text())["segments"]:
+            logger.info("%(kind)12s: %(frames)5d frames from %(keyframes)d keyframes", segment)
+        print(path)
+    else:
+        player = TimelinePlayer(args.timeline)
+        output = args.output or Path(args.timeline).with_suffix(".mp4")
+        print(player.render(output, args.resolution, args.background_color))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+SOURCE_DIR = Path(__file__).parent / "002_ai_vs_ml.py"
+
+
+def load_source(relative_path: str):
+    """Import one source file by path, without running the package ``__init__`` (which needs manim)."""
+    path = SOURCE_DIR / relative_path
+    name = path.stem
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def source():
+    return load_source
+
+
+@pytest.fixture(scope="session")
+def manim_module():
+    """Import a module of the package by name, skipping the test where manim is not importable."""
+    pytest.importorskip("manim")
+    if str(SOURCE_DIR) not in sys.path:
+        sys.path.insert(0, str(SOURCE_DIR))
+    return importlib.import_module
+
+
+@pytest.fixture(scope="session")
+def blocks(manim_module):
+    return manim_module("blocks")
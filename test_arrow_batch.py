@@ -0,0 +1,24 @@
+import numpy as np
+
+
+def test_arrow_animation_keeps_the_drawn_paths(blocks):
+    batch = blocks.ArrowBatch(np.zeros((4, 3)), np.tile([1.0, -1.0, 0.0], (4, 1)))
+    animation = batch.views()[2].animate.set_color("#FF0000")
+    animation.begin()
+    submobjects = list(batch.submobjects)
+    points = [mob.points for mob in submobjects]
+
+    for alpha in np.linspace(0, 1, 5):
+        animation.interpolate_mobject(alpha)
+        assert all(a is b for a, b in zip(batch.submobjects, submobjects))
+        assert len(batch.submobjects) == len(submobjects)
+    assert all(mob.points is p for mob, p in zip(batch.submobjects, points))
+
+    # The isolated pair of the animated arrow carries the target colour
+    path = batch._path_of[2]
+    for mob in batch.submobjects[path : path + 2]:
+        assert np.allclose(mob.stroke_rgbas[:, :3], [1, 0, 0])
+
+    animation.finish()
+    assert len(batch.submobjects) == 4
+    assert np.allclose(batch.colors[2], [1, 0, 0])
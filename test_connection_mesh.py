@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="module")
+def mesh_geometry(source):
+    return source("blocks/mesh_geometry.py")
+
+
+def test_between_edges_are_source_major(mesh_geometry):
+    sources = [[0, 0, 0], [0, 1, 0]]
+    targets = [[1, 0, 0], [1, 1, 0], [1, 2, 0]]
+    starts, ends, source_index, target_index = mesh_geometry.complete_bipartite(sources, targets)
+
+    assert np.array_equal(source_index, [0, 0, 0, 1, 1, 1])
+    assert np.array_equal(target_index, [0, 1, 2, 0, 1, 2])
+    assert np.array_equal(starts, np.asarray(sources, dtype=float)[source_index])
+    assert np.array_equal(ends, np.asarray(targets, dtype=float)[target_index])
+
+
+def test_bundles_group_between_edges_by_neuron(mesh_geometry):
+    sources = np.column_stack([np.zeros(8), np.arange(8), np.zeros(8)])
+    targets = np.column_stack([np.ones(8), np.arange(8), np.zeros(8)])
+    _, _, source_index, target_index = mesh_geometry.complete_bipartite(sources, targets)
+    labels = mesh_geometry.bundle_labels(source_index, target_index, groups=4)
+
+    # 4 source groups times 4 target groups, each holding 2 x 2 neurons
+    assert len(np.unique(labels)) == 16
+    assert np.all(np.bincount(labels) == 4)
+    for band in np.unique(labels):
+        members = labels == band
+        assert len(np.unique(source_index[members] // 2)) == 1
+        assert len(np.unique(target_index[members] // 2)) == 1
+
+
+def test_convex_hull_area(mesh_geometry):
+    square = np.array([[0, 0], [2, 0], [2, 2], [0, 2], [1, 1], [1, 0]], dtype=float)
+    hull = mesh_geometry.convex_hull(square)
+
+    assert len(hull) == 4
+    assert mesh_geometry.polygon_area(hull) == pytest.approx(4)
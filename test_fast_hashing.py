@@ -0,0 +1,28 @@
+def test_member_digests_are_memoized_until_a_buffer_changes(manim_module):
+    import manim as mn
+
+    fast_hashing = manim_module("fast_hashing")
+    fast_hashing.install_digest_invalidation()
+    square = mn.Square()
+    digest = fast_hashing.member_digest(square)
+    assert fast_hashing.member_digest(square) is digest
+
+    # update_rgbas_array writes into the existing array
+    square.set_fill(mn.RED, opacity=0.5)
+    recoloured = fast_hashing.member_digest(square)
+    assert recoloured != digest
+
+    square.shift(mn.RIGHT)
+    assert fast_hashing.member_digest(square) != recoloured
+
+
+def test_value_tracker_digest_follows_set_value(manim_module):
+    import manim as mn
+
+    fast_hashing = manim_module("fast_hashing")
+    fast_hashing.install_digest_invalidation()
+    tracker = mn.ValueTracker(1)
+    digest = fast_hashing.member_digest(tracker)
+
+    tracker.set_value(2)
+    assert fast_hashing.member_digest(tracker) != digest
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="module")
+def tree_spec(source):
+    return source("blocks/tree_spec.py")
+
+
+@pytest.fixture(scope="module")
+def grid_layout(source):
+    return source("blocks/grid_layout.py")
+
+
+FRUIT_TREE = {
+    "question": "Is it soft?",
+    "feature": 0,
+    "threshold": 0.5,
+    "left": {"label": "Unripe"},
+    "right": {
+        "question": "Is it sweet?",
+        "feature": 1,
+        "threshold": 0.3,
+        "left": {"label": "Rotten"},
+        "right": {"label": "Perfect", "color": "#00FF00"},
+    },
+}
+
+
+def test_tree_spec_from_dict_is_preorder(tree_spec):
+    spec = tree_spec.TreeSpec.from_dict(FRUIT_TREE)
+
+    assert len(spec) == 5
+    assert spec.texts == ["Is it soft?", "Unripe", "Is it sweet?", "Rotten", "Perfect"]
+    assert list(spec.children_left) == [1, -1, 3, -1, -1]
+    assert list(spec.children_right) == [2, -1, 4, -1, -1]
+    assert spec.colors[0] == tree_spec.DECISION_COLOR
+    assert spec.colors[1:4:2] == tree_spec.LEAF_COLORS[:2]
+    assert spec.colors[4] == "#00FF00"
+
+
+def test_tree_spec_decision_path(tree_spec):
+    spec = tree_spec.TreeSpec.from_dict(FRUIT_TREE)
+
+    assert spec.decision_path([0.2, 0.9]) == [0, 1]
+    assert spec.decision_path([0.8, 0.1]) == [0, 2, 3]
+    assert spec.decision_path([0.8, 0.9]) == [0, 2, 4]
+
+
+def test_tree_spec_from_arrays_labels_leaves_by_majority(tree_spec):
+    spec = tree_spec.TreeSpec.from_arrays(
+        [1, -1, -1],
+        [2, -1, -1],
+        [0, -2, -2],
+        [1.5, -2, -2],
+        [[[4, 4]], [[3, 1]], [[1, 3]]],
+        feature_names=["size"],
+        class_names=["small", "large"],
+    )
+
+    assert spec.texts == ["size <= 1.50", "small", "large"]
+    assert spec.colors[1:] == tree_spec.LEAF_COLORS[:2]
+
+
+@pytest.mark.parametrize("n_items", [1, 3, 7, 12])
+def test_grid_layout_fits_the_frame(grid_layout, n_items):
+    rows, cols, scale = grid_layout.calculate_grid_layout(n_items, 4, 3, 16, 9, buff=1, margin=0.9)
+
+    assert rows * cols >= n_items
+    assert (rows - 1) * cols < n_items
+    assert (cols * 4 + (cols - 1)) * scale <= 16 * 0.9 + 1e-9
+    assert (rows * 3 + (rows - 1)) * scale <= 9 * 0.9 + 1e-9
+
+
+def test_grid_offsets_are_row_major_and_centred(grid_layout):
+    offsets = grid_layout.grid_offsets(5, 2, 3, 2.0, 1.0)
+
+    assert np.allclose(offsets[:3, 1], 0.5)
+    assert np.allclose(offsets[3:, 1], -0.5)
+    assert np.allclose(offsets[:3, 0], [-2, 0, 2])
+    assert np.allclose(offsets[3:, 0], [-2, 0])
+    assert np.allclose(offsets[:, 2], 0)
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="module")
+def network_model(source):
+    return source("network_model.py")
+
+
+def reference_forward(model, inputs):
+    activations = [inputs]
+    for weights, bias in zip(model.weights, model.biases):
+        activations.append(1 / (1 + np.exp(-(activations[-1] @ weights + bias))))
+    return activations
+
+
+def test_forward_matches_dense_sigmoid_layers(network_model):
+    model = network_model.NetworkModel((5, 4, 3), seed=1)
+    inputs = model.random_inputs(7)
+    activations = model.forward(inputs)
+
+    assert [layer.shape for layer in activations] == [(7, 5), (7, 4), (7, 3)]
+    for layer, expected in zip(activations, reference_forward(model, inputs)):
+        assert np.allclose(layer, expected)
+
+
+def test_stream_matches_forward_across_batches(network_model):
+    model = network_model.NetworkModel((5, 4, 3), seed=2)
+    inputs = model.random_inputs(10)
+    expected = model.forward(inputs)
+
+    streamed = [
+        [values.copy() for values in layers]
+        for layers in model.stream(iter(inputs), batch_size=4)
+    ]
+
+    assert len(streamed) == 10
+    for layer, expected_layer in enumerate(expected):
+        assert np.allclose([layers[layer] for layers in streamed], expected_layer)
+
+
+def test_edge_contributions_are_source_major(network_model):
+    model = network_model.NetworkModel((3, 2), seed=3)
+    activations = np.array([1.0, -2.0, 0.5])
+    contributions = model.edge_contributions(0, activations)
+
+    assert contributions.shape == (6,)
+    assert contributions[1 * 2 + 0] == pytest.approx(abs(-2.0 * model.weights[0][1, 0]))
+
+
+def test_most_active_is_sorted_strongest_first(network_model):
+    activations = np.array([0.1, 0.9, 0.4, 0.7, 0.2])
+
+    assert list(network_model.NetworkModel.most_active(activations, 3)) == [1, 3, 2]
+    assert len(network_model.NetworkModel.most_active(activations, 10)) == 5
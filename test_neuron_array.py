@@ -0,0 +1,50 @@
+import numpy as np
+
+
+def test_neuron_animation_keeps_the_drawn_paths(blocks):
+    array = blocks.NeuronArray.in_row(6)
+    animation = array.animate_neurons([1, 4]).set_fill("#00FF00", opacity=0.5).scale(1.5)
+    animation.begin()
+    submobjects = list(array.submobjects)
+
+    for alpha in np.linspace(0, 1, 5):
+        animation.interpolate_mobject(alpha)
+        assert len(array.submobjects) == len(submobjects)
+        assert all(a is b for a, b in zip(array.submobjects, submobjects))
+
+    # The animated neurons are drawn with their exact style while the play runs
+    for index in (1, 4):
+        path = array.submobjects[array._path_of[index]]
+        assert np.allclose(path.fill_rgbas[:, :3], [0, 1, 0])
+        assert np.allclose(path.fill_rgbas[:, 3], 0.5)
+    assert np.allclose(array.get_centers()[:, 0], np.arange(6) * 3 - 7.5)
+    assert np.allclose(array.radii, [1, 1.5, 1, 1, 1.5, 1])
+
+    animation.finish()
+    assert len(array.submobjects) == 2
+
+
+def test_layer_activation_fades_compact_neurons_in_place(blocks):
+    import manim as mn
+
+    array = blocks.NeuronArray.in_row(5)
+    layer = mn.VGroup(array)
+    layer.compact = True
+    layer.neuron_array = array
+    layer.neurons = array.views()
+    layer.activations = array.activations
+    target = np.linspace(0.1, 0.9, 5)
+
+    animation = blocks.LayerActivation(layer, target)
+    animation.begin()
+    submobjects = list(array.submobjects)
+    animation.interpolate_mobject(0.5)
+    assert all(a is b for a, b in zip(array.submobjects, submobjects))
+    assert len(array.submobjects) == 5
+
+    animation.interpolate_mobject(1)
+    for index, opacity in enumerate(target):
+        assert np.allclose(array.submobjects[array._path_of[index]].fill_rgbas[:, 3], opacity)
+
+    animation.finish()
+    assert np.allclose(layer.activations, target)
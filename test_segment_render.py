@@ -0,0 +1,40 @@
+import pytest
+
+
+@pytest.fixture(scope="module")
+def segment_render(source):
+    return source("segment_render.py")
+
+
+def test_long_first_play_gets_a_segment_of_its_own(segment_render):
+    assert segment_render.split_timeline([10, 1, 1], 2) == [(0, 1), (1, 3)]
+
+
+def test_segments_cover_every_play_once(segment_render):
+    durations = [0.5, 3, 1, 1, 0.25, 2, 2, 1]
+    segments = segment_render.split_timeline(durations, 3)
+
+    assert len(segments) == 3
+    assert segments[0][0] == 0
+    assert segments[-1][1] == len(durations)
+    assert all(end == start for (_, end), (start, _) in zip(segments, segments[1:]))
+
+
+def test_one_play_first_segment_stops_after_play_zero(manim_module):
+    import manim as mn
+
+    segment_render = manim_module("segment_render")
+    played = []
+
+    class ThreePlays(mn.Scene):
+        def construct(self):
+            for _ in range(3):
+                self.wait(0.1)
+                played.append(self.renderer.num_plays)
+
+    with mn.tempconfig(
+        {"write_to_movie": False, "save_last_frame": False, "progress_bar": "none"}
+    ):
+        segment_render.segment_scene_class(ThreePlays, end=1)().render()
+
+    assert played == [1]
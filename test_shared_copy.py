@@ -0,0 +1,30 @@
+import numpy as np
+
+
+def test_shared_copy_shares_until_either_side_changes(blocks):
+    import manim as mn
+
+    block = blocks.InputBlock("Input")
+    clone = block.copy()
+    box, clone_box = block[0], clone[0]
+    original_points = box.points.copy()
+    original_fill = box.fill_rgbas.copy()
+    assert np.shares_memory(box.points, clone_box.points)
+
+    # Ancestors move points with in-place arithmetic, the original must not follow
+    mn.VGroup(clone).scale(2).shift(mn.RIGHT)
+    assert np.array_equal(box.points, original_points)
+
+    clone_box.set_fill(mn.RED)
+    assert np.array_equal(box.fill_rgbas, original_fill)
+    assert not np.array_equal(clone_box.fill_rgbas, original_fill)
+
+
+def test_shared_copy_leaves_other_mobjects_alone(blocks):
+    import manim as mn
+
+    blocks.InputBlock("Input").copy()
+    square = mn.Square()
+
+    assert type(square) is mn.Square
+    assert type(square.points) is np.ndarray
@@ -0,0 +1,15 @@
+def test_fingerprint_changes_when_a_member_of_a_container_changes(manim_module):
+    import manim as mn
+
+    static_layers = manim_module("static_layers")
+    dots = [mn.Dot(), mn.Dot().shift(mn.RIGHT)]
+    mesh = mn.VGroup(mn.VGroup(*dots))
+    key = static_layers.fingerprint([mesh])
+    assert static_layers.fingerprint([mesh]) == key
+
+    dots[1].set_color(mn.RED)
+    recoloured = static_layers.fingerprint([mesh])
+    assert recoloured != key
+
+    dots[0].shift(mn.UP)
+    assert static_layers.fingerprint([mesh]) != recoloured
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="module")
+def tree_layout(source):
+    return source("blocks/tree_layout.py")
+
+
+def random_tree(n_nodes, seed):
+    """Children lists of a random tree with up to two children per node."""
+    rng = np.random.default_rng(seed)
+    children = [[] for _ in range(n_nodes)]
+    for node in range(1, n_nodes):
+        parent = rng.choice([other for other in range(node) if len(children[other]) < 2])
+        children[parent].append(node)
+    return children
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_nodes_on_one_level_do_not_overlap(tree_layout, seed):
+    children = random_tree(60, seed)
+    x, depth = tree_layout.tidy_tree_layout(children, distance=1.5)
+
+    for level in np.unique(depth):
+        # Left to right order of the level is the pre-order of its nodes
+        level_nodes = [node for node in tree_layout.preorder(children) if depth[node] == level]
+        assert np.all(np.diff(x[level_nodes]) >= 1.5 - 1e-9)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_parents_are_centred_over_their_children(tree_layout, seed):
+    children = random_tree(60, seed)
+    x, depth = tree_layout.tidy_tree_layout(children)
+
+    assert x[0] == 0
+    assert depth[0] == 0
+    for node, kids in enumerate(children):
+        if kids:
+            assert x[node] == pytest.approx((x[kids[0]] + x[kids[-1]]) / 2)
+            assert np.all(depth[kids] == depth[node] + 1)
+
+
+def test_children_from_sklearn_arrays(tree_layout):
+    children = tree_layout.tree_children([1, -1, 3, -1, -1], [2, -1, 4, -1, -1])
+
+    assert children == [[1, 2], [], [3, 4], [], []]
+    assert list(tree_layout.tree_parents(children)) == [-1, 0, 0, 2, 2]
+    assert tree_layout.preorder(children) == [0, 1, 2, 3, 4]